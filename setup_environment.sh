@@ -1,4 +1,6 @@
 #!/bin/bash
 echo "[SETUP] Installing Python core dependencies..."
 pip install --user -r requirements.txt
+echo "[SETUP] Installing optional accelerators (blake3, orjson)..."
+pip install --user -r requirements-optional.txt || echo "[SETUP] Optional accelerators unavailable; continuing without them."
 echo "[SETUP] Core environment ready. Note: NLU/torch libraries require manual installation if supported."
@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import gestalt_core
+
+
+class InterpretInputTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.chloe = gestalt_core.GestaltIntelligence(base_dir=Path(tmp.name))
+        self.addCleanup(self.chloe.close_reflect_log)
+
+    def _run(self, command: str):
+        with self.assertLogs(gestalt_core.log, "INFO") as logs:
+            result = self.chloe._interpret_input(command)
+        return result, "\n".join(logs.output)
+
+    def _events(self, event: str) -> list:
+        return [rec for rec in list(self.chloe.memory) if rec["event"] == event]
+
+    def test_exit_commands(self):
+        for command in ("exit", " Quit "):
+            self.assertEqual(self.chloe._interpret_input(command), "exit")
+
+    def test_status(self):
+        _, output = self._run("Status")
+        self.assertIn("Chloe Status", output)
+        self.assertIn("Current Time:", output)
+        self.assertEqual(len(self._events("CLI_STATUS_CHECK")), 1)
+
+    def test_save_and_recall_memory(self):
+        self._run("save memory: favourite_colour = Blue")
+        self.assertEqual(self.chloe.core_mem["favourite_colour"], "Blue")
+        _, output = self._run("Recall Memory: favourite_colour")
+        self.assertIn("Blue", output)
+
+    def test_shell_command(self):
+        _, output = self._run("execute shell: echo cli-ok")
+        self.assertIn("cli-ok", output)
+        self.assertEqual(len(self._events("SHELL_COMMAND_SUCCESS")), 1)
+
+    def test_xform(self):
+        _, output = self._run("xform SYSTEM_PROFILE")
+        self.assertIn("[TRANSFORM RESULT]", output)
+        self.assertEqual(len(self._events("TRANSFORM_REQUEST")), 1)
+
+    def test_unrecognized_input_is_reflected(self):
+        self.assertIsNone(self._run("hello there")[0])
+        self.assertEqual(len(self._events("UNRECOGNIZED_INPUT")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import gestalt_core
+
+
+class CoreLoopTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.chloe = gestalt_core.GestaltIntelligence(base_dir=Path(tmp.name))
+        self.addCleanup(self.chloe.close_reflect_log)
+
+    def _events(self, event: str) -> list:
+        return [rec for rec in list(self.chloe.memory) if rec["event"] == event]
+
+    def test_loop_ticks_and_stops_promptly(self):
+        start_tick = self.chloe.state["tick"]
+        loop = threading.Thread(target=self.chloe.loop, daemon=True)
+        loop.start()
+        time.sleep(1.2) # Two or three 0.5 s ticks
+        stop_requested = time.monotonic()
+        self.chloe.request_stop()
+        loop.join(timeout=5)
+        self.assertFalse(loop.is_alive(), "core loop did not stop")
+        self.assertLess(time.monotonic() - stop_requested, 1.0)
+        self.assertGreaterEqual(self.chloe.state["tick"] - start_tick, 2)
+        self.assertEqual(len(self._events("CORE_LOOP_START")), 1)
+        self.assertEqual(self._events("CORE_LOOP_ERROR"), [])
+        stopped = self._events("CORE_LOOP_STOPPED")
+        self.assertEqual(stopped[0]["details"]["final_tick"], self.chloe.state["tick"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import gestalt_core
+
+SOURCE = Path(gestalt_core.__file__).read_text(encoding="utf-8")
+
+
+class MutateSourceTokensTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(1234)
+
+    def test_only_mutated_lines_change(self):
+        with mock.patch.multiple(gestalt_core, STRING_MUTATION_RATE=0.05, NUMBER_MUTATION_RATE=0.05):
+            code, count, _, _ = gestalt_core._mutate_source_tokens(SOURCE)
+        before, after = SOURCE.splitlines(), code.splitlines()
+        self.assertEqual(len(before), len(after))
+        changed = [i for i, (a, b) in enumerate(zip(before, after)) if a != b]
+        self.assertGreater(count, 1)
+        # One line per mutation at most (several tokens may share a line); comments, spacing and
+        # backslash continuations elsewhere come through untouched
+        self.assertLessEqual(len(changed), count)
+        compile(code, "<evolved>", "exec")
+
+    def test_no_mutations_keeps_source_verbatim_except_version(self):
+        with mock.patch.object(gestalt_core, "_mutation_gap", return_value=10 ** 9):
+            code, count, _, _ = gestalt_core._mutate_source_tokens(SOURCE)
+        self.assertEqual(count, 1) # Only the RUNTIME_VERSION bump
+        m = gestalt_core._RUNTIME_VERSION_RE.search(SOURCE)
+        expected = f"{m.group(1)}{int(m.group(3)) + 1}{m.group(4)}"
+        self.assertEqual(code, SOURCE[:m.start()] + expected + SOURCE[m.end():])
+
+    def test_reports_tchart_and_evolve_class_rows(self):
+        code, _, tchart_rows, class_rows = gestalt_core._mutate_source_tokens(SOURCE)
+        lines = code.splitlines()
+        self.assertTrue(lines[tchart_rows[0] - 1].startswith("TCHART_DATA"))
+        self.assertTrue(lines[class_rows[0] - 1].startswith("class GeneticEvolutionTransform"))
+
+
+class EvolveSpliceTest(unittest.TestCase):
+    def _evolve(self, script: Path) -> str:
+        with mock.patch.object(sys, "argv", [str(script)]):
+            out = gestalt_core.GeneticEvolutionTransform(b"", None).execute()
+        self.assertFalse(out.startswith(b"ERROR"), out[:200])
+        return out.decode("utf-8")
+
+    def _assert_spliced(self, code: str):
+        compile(code, "<evolved>", "exec")
+        lines = code.splitlines()
+        tchart = [line for line in lines if line.startswith("TCHART_DATA = ")]
+        self.assertEqual(tchart, [f"TCHART_DATA = {gestalt_core._TCHART_REPR}"])
+        self.assertEqual(sum(line.startswith("class GeneticEvolutionTransform(") for line in lines), 1)
+        self.assertIn("\n".join(gestalt_core._INJECTED_EVOLVE_LINES_BY_INDENT[0]), code)
+
+    def test_evolved_source_gets_current_tchart_and_injected_class(self):
+        random.seed(7)
+        code = self._evolve(Path(gestalt_core.__file__))
+        self._assert_spliced(code)
+        # Everything outside the two spliced regions is the mutated self-source
+        self.assertIn("class GestaltIntelligence:", code)
+        self.assertIn("def _mutate_source_tokens(", code)
+
+    def test_evolved_source_evolves_again(self):
+        random.seed(8)
+        with tempfile.TemporaryDirectory() as tmp:
+            first = Path(tmp) / "gen1.py"
+            first.write_text(self._evolve(Path(gestalt_core.__file__)), encoding="utf-8")
+            self._assert_spliced(self._evolve(first))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import hmac
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import gestalt_core
+
+KEY = b"test-mutation-key"
+
+
+def _free_udp_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _signed(payload: bytes, nonce: bytes = None, key: bytes = KEY) -> bytes:
+    # Datagram layout: HMAC-SHA256(key, nonce + payload) + nonce + payload
+    nonce = nonce or os.urandom(gestalt_core.MUTATION_NONCE_LEN)
+    return hmac.digest(key, nonce + payload, "sha256") + nonce + payload
+
+
+class MutationListenerTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.port = _free_udp_port()
+        patcher = mock.patch.multiple(gestalt_core, MUTATION_KEY=KEY, UDP_LISTENER_PORT=self.port)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.chloe = gestalt_core.GestaltIntelligence(base_dir=Path(tmp.name))
+        self.addCleanup(self.chloe.close_reflect_log)
+        self.listener = threading.Thread(target=self.chloe.mutation_listener, daemon=True)
+        self.listener.start()
+        self.addCleanup(self._stop_listener)
+        self._wait_for_event("MUTATION_LISTENER_ACTIVE")
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(self.sock.close)
+
+    def _stop_listener(self):
+        self.chloe.request_stop()
+        self.listener.join(timeout=5)
+        self.assertFalse(self.listener.is_alive(), "listener did not stop")
+
+    def _events(self, event: str) -> list:
+        return [rec for rec in list(self.chloe.memory) if rec["event"] == event]
+
+    def _wait_for_event(self, event: str, count: int = 1, timeout: float = 5.0) -> list:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            found = self._events(event)
+            if len(found) >= count:
+                return found
+            self.assertTrue(self.listener.is_alive(), "listener thread died")
+            time.sleep(0.01)
+        self.fail(f"{event} x{count} not reflected within {timeout}s")
+
+    def _send(self, datagram: bytes):
+        self.sock.sendto(datagram, ("127.0.0.1", self.port))
+
+    def test_signed_datagram_is_executed(self):
+        self._send(_signed(b"chloe.mutation_hits = getattr(chloe, 'mutation_hits', 0) + 1"))
+        self._wait_for_event("MUTATION_SUCCESS")
+        self.assertEqual(self.chloe.mutation_hits, 1)
+
+    def test_bad_signature_is_dropped(self):
+        self._send(_signed(b"chloe.mutation_hits = 1", key=b"wrong-key"))
+        self._send(b"too short")
+        self._wait_for_event("MUTATION_AUTH_DROP", count=2)
+        self.assertFalse(hasattr(self.chloe, "mutation_hits"))
+        self.assertEqual(self._events("MUTATION_SUCCESS"), [])
+
+    def test_replayed_nonce_is_dropped(self):
+        datagram = _signed(b"chloe.mutation_hits = getattr(chloe, 'mutation_hits', 0) + 1")
+        self._send(datagram)
+        self._send(datagram)
+        self._wait_for_event("MUTATION_REPLAY_DROP")
+        self._wait_for_event("MUTATION_SUCCESS")
+        self.assertEqual(self.chloe.mutation_hits, 1)
+
+    def test_same_payload_new_nonce_reuses_compiled_code(self):
+        payload = b"chloe.mutation_hits = getattr(chloe, 'mutation_hits', 0) + 1"
+        for _ in range(3):
+            self._send(_signed(payload))
+        self._wait_for_event("MUTATION_SUCCESS", count=3)
+        self.assertEqual(self.chloe.mutation_hits, 3)
+        self.assertEqual(len(self.chloe._mutation_code_cache), 1)
+
+    def test_oversize_datagram_is_dropped(self):
+        self._send(_signed(b"#" * gestalt_core.MUTATION_MAX_PAYLOAD))
+        self._wait_for_event("MUTATION_OVERSIZE_DROP")
+        self.assertEqual(self._events("MUTATION_SUCCESS"), [])
+
+    def test_failing_payload_is_reflected(self):
+        self._send(_signed(b"raise ValueError('bad payload')"))
+        failed = self._wait_for_event("MUTATION_FAILED")
+        self.assertIn("bad payload", failed[0]["details"]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
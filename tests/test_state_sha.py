@@ -0,0 +1,83 @@
+import copy
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import gestalt_core
+
+
+class ShaTrackedDictTest(unittest.TestCase):
+    def setUp(self):
+        self.on_write = mock.Mock()
+        self.d = gestalt_core._ShaTrackedDict(self.on_write, frozenset(("volatile",)), {"a": 1, "volatile": 0})
+
+    def test_writes_to_hashed_keys_notify(self):
+        writes = [
+            lambda d: d.__setitem__("b", 2),
+            lambda d: d.__delitem__("a"),
+            lambda d: d.pop("b"),
+            lambda d: d.setdefault("c", 3),
+            lambda d: d.update(e=5),
+            lambda d: d.__ior__({"f": 6}),
+            lambda d: d.popitem(),
+            lambda d: d.clear(),
+        ]
+        for write in writes:
+            self.on_write.reset_mock()
+            write(self.d)
+            self.on_write.assert_called_once_with()
+
+    def test_writes_to_excluded_keys_do_not_notify(self):
+        self.d["volatile"] = 1
+        self.d.pop("volatile")
+        self.d.setdefault("volatile", 2)
+        self.on_write.assert_not_called()
+
+    def test_reads_do_not_notify(self):
+        self.d.get("a")
+        _ = self.d["a"], list(self.d.items()), "a" in self.d
+        self.on_write.assert_not_called()
+
+    def test_copies_are_plain_dicts(self):
+        for clone in (copy.copy(self.d), copy.deepcopy(self.d), pickle.loads(pickle.dumps(self.d))):
+            self.assertIs(type(clone), dict)
+            self.assertEqual(clone, {"a": 1, "volatile": 0})
+
+
+class MakeShaInvalidationTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.chloe = gestalt_core.GestaltIntelligence(base_dir=Path(tmp.name))
+        self.addCleanup(self.chloe.close_reflect_log)
+        self.addCleanup(self.chloe.request_stop)
+
+    def test_direct_writes_change_the_cached_sha(self):
+        before = self.chloe._make_sha()
+        self.chloe.core_mem["written_directly"] = True
+        after = self.chloe._make_sha()
+        self.assertNotEqual(before, after)
+        self.assertEqual(after, self.chloe._make_sha(fresh=True))
+        del self.chloe.core_mem["written_directly"]
+        self.assertEqual(self.chloe._make_sha(), before)
+        self.chloe.state["new_state_key"] = [1, 2]
+        self.assertEqual(self.chloe._make_sha(), self.chloe._make_sha(fresh=True))
+
+    def test_volatile_writes_keep_the_cache(self):
+        self.chloe._make_sha()
+        self.chloe.state["tick"] += 1
+        self.chloe._refresh_current_time()
+        self.assertEqual(set(self.chloe._sha_part_cache), {"state", "core_mem"})
+
+    def test_tracking_survives_self_heal(self):
+        self.chloe.cert_file.unlink()
+        self.chloe.self_heal()
+        before = self.chloe._make_sha()
+        self.chloe.core_mem["after_heal"] = 1
+        self.assertNotEqual(self.chloe._make_sha(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
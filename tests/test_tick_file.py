@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import gestalt_core
+
+WIDTH = gestalt_core.TICK_FILE_WIDTH
+
+
+class TickFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = Path(tmp.name)
+        self.tick_file = self.base / "tick.count"
+
+    def _boot(self) -> gestalt_core.GestaltIntelligence:
+        chloe = gestalt_core.GestaltIntelligence(base_dir=self.base)
+        self.addCleanup(chloe._close_tick_map)
+        self.addCleanup(chloe.close_reflect_log)
+        self.addCleanup(chloe.request_stop)
+        return chloe
+
+    def _expected(self, tick: int) -> bytes:
+        return b"%0*d\n" % (WIDTH - 1, tick)
+
+    def test_new_file_is_created_at_fixed_width(self):
+        chloe = self._boot()
+        self.assertEqual(chloe.state["tick"], 0)
+        self.assertEqual(self.tick_file.read_bytes(), self._expected(0))
+
+    def test_legacy_variable_length_file_is_read_and_widened(self):
+        self.tick_file.write_bytes(b"42\n")
+        chloe = self._boot()
+        self.assertEqual(chloe.state["tick"], 42)
+        self.assertEqual(self.tick_file.read_bytes(), self._expected(42))
+
+    def test_corrupt_file_resets_to_zero(self):
+        self.tick_file.write_bytes(b"not a number")
+        chloe = self._boot()
+        self.assertEqual(chloe.state["tick"], 0)
+        self.assertEqual(self.tick_file.read_bytes(), self._expected(0))
+
+    def test_saves_write_through_the_mapping_and_persist(self):
+        chloe = self._boot()
+        chloe.state["tick"] = 12345
+        chloe._save_tick()
+        self.assertEqual(self.tick_file.read_bytes(), self._expected(12345))
+        chloe._close_tick_map()
+        self.assertEqual(self._boot().state["tick"], 12345)
+
+    def test_self_heal_remaps_the_tick_file(self):
+        chloe = self._boot()
+        chloe.state["tick"] = 7
+        chloe._save_tick()
+        old_map = chloe._tick_mm
+        chloe.cert_file.unlink()
+        chloe.self_heal()
+        self.assertTrue(old_map.closed)
+        self.assertEqual(chloe.state["tick"], 7)
+        chloe.state["tick"] = 8
+        chloe._save_tick()
+        self.assertEqual(self.tick_file.read_bytes(), self._expected(8))
+
+
+if __name__ == "__main__":
+    unittest.main()